@@ -5,6 +5,7 @@ Periodically exports job, subjob, and event data from TimescaleDB to S3.
 Supports 10-year archival with efficient Parquet format.
 """
 import os
+import time
 import asyncio
 import asyncpg
 import pandas as pd
@@ -15,7 +16,9 @@ from botocore.exceptions import ClientError
 # Import shared utilities
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+APPS_DIR = str(Path(__file__).parent.parent)
+if APPS_DIR not in sys.path:
+    sys.path.insert(0, APPS_DIR)
 from shared_utils import setup_logging, get_logger, trace_async
 from shared_utils import ArchiverConfig
 
@@ -126,6 +129,7 @@ async def archive_cycle() -> None:
     
     Exports data from the previous hour for all tables.
     """
+    cycle_start = time.monotonic()
     now = datetime.now(timezone.utc)
     # Archive the previous complete hour
     end = now.replace(minute=0, second=0, microsecond=0)
@@ -153,7 +157,7 @@ async def archive_cycle() -> None:
     logger.info(
         "archive_cycle_completed",
         total_rows=total_rows,
-        duration_s=(datetime.now(timezone.utc) - now).total_seconds()
+        duration_s=time.monotonic() - cycle_start
     )
 
 
@@ -195,4 +199,10 @@ async def main() -> None:
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    # Run on uvloop when installed (uvicorn[standard] pulls it in), like the API services
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -5,17 +5,25 @@ Federates queries across multiple Local API instances.
 Provides a unified interface for cross-site monitoring.
 """
 import os
+import heapq
+import asyncio
+import hashlib
 import httpx
+import orjson
 import time
+from collections import OrderedDict
+from itertools import islice, repeat
 from fastapi import FastAPI, HTTPException, Query, Request, Response
-from fastapi.responses import JSONResponse
-from typing import Optional
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Optional, Tuple
 from datetime import datetime, timedelta
 
 # Import shared utilities
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+APPS_DIR = str(Path(__file__).parent.parent)
+if APPS_DIR not in sys.path:
+    sys.path.insert(0, APPS_DIR)
 from shared_utils import setup_logging, get_logger, setup_tracing, instrument_fastapi
 from shared_utils import MetricsCollector, get_metrics_collector, trace_async
 from shared_utils import CentralAPIConfig
@@ -52,13 +60,16 @@ app = FastAPI(
 if config.enable_tracing:
     instrument_fastapi(app)
 
+# Short-lived LRU cache of site responses: key -> (expires_at, body, etag)
+_response_cache: "OrderedDict[tuple, Tuple[float, dict, str]]" = OrderedDict()
+
 
 @app.middleware("http")
 async def metrics_middleware(request: Request, call_next):
     """Middleware to collect HTTP metrics."""
-    start_time = time.time()
+    start_time = time.monotonic()
     response = await call_next(request)
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     
     metrics.record_http_request(
         method=request.method,
@@ -70,6 +81,32 @@ async def metrics_middleware(request: Request, call_next):
     return response
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared HTTP client used to reach local sites.
+    
+    One pooled client keeps connections to every site alive across
+    requests instead of reconnecting per call.
+    
+    Returns:
+        Shared async HTTP client
+    """
+    if not hasattr(app.state, 'http_client'):
+        app.state.http_client = httpx.AsyncClient(
+            timeout=config.request_timeout_s,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+    return app.state.http_client
+
+
+@app.on_event('shutdown')
+async def shutdown() -> None:
+    """Shutdown handler - close the shared HTTP client."""
+    if hasattr(app.state, 'http_client'):
+        await app.state.http_client.aclose()
+        logger.info("http_client_closed")
+
+
 @trace_async("pass_get")
 async def pass_get(site: str, path: str, params: dict) -> dict:
     """
@@ -93,21 +130,16 @@ async def pass_get(site: str, path: str, params: dict) -> dict:
     
     try:
         logger.debug("forwarding_request", site=site, path=path)
-        async with httpx.AsyncClient() as client:
-            r = await client.get(
-                base + path,
-                params=params,
-                timeout=config.request_timeout_s
-            )
-            r.raise_for_status()
-            
-            logger.info(
-                "request_forwarded",
-                site=site,
-                path=path,
-                status_code=r.status_code
-            )
-            return r.json()
+        r = await get_http_client().get(base + path, params=params)
+        r.raise_for_status()
+        
+        logger.info(
+            "request_forwarded",
+            site=site,
+            path=path,
+            status_code=r.status_code
+        )
+        return r.json()
     
     except httpx.HTTPError as e:
         logger.error(
@@ -120,44 +152,303 @@ async def pass_get(site: str, path: str, params: dict) -> dict:
         raise HTTPException(502, f'Failed to reach site {site}: {str(e)}')
 
 
+def _cache_lookup(key: tuple, cache: str) -> Optional[Tuple[dict, str]]:
+    """
+    Return a fresh cached (body, ETag) for key, or None.
+    
+    Args:
+        key: Cache key
+        cache: Cache name used for hit/miss metrics
+        
+    Returns:
+        Cached body and ETag, or None on miss/expiry
+    """
+    entry = _response_cache.get(key)
+    hit = entry is not None and entry[0] > time.monotonic()
+    metrics.record_cache_lookup(cache, hit)
+    if not hit:
+        return None
+    _response_cache.move_to_end(key)
+    return entry[1], entry[2]
+
+
+def _cache_store(key: tuple, body: dict, etag: str) -> None:
+    """Store a response and evict least recently used entries over the cap."""
+    _response_cache[key] = (time.monotonic() + config.cache_ttl_s, body, etag)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > config.cache_max_entries:
+        _response_cache.popitem(last=False)
+
+
+async def cached_get(site: str, path: str, params: dict) -> Tuple[dict, str]:
+    """
+    Forward a GET request, serving repeat queries from the response cache.
+    
+    Identical queries within `config.cache_ttl_s` are answered without
+    contacting the site.
+    
+    Args:
+        site: Site identifier
+        path: API path to query
+        params: Query parameters
+        
+    Returns:
+        Tuple of (response body, ETag)
+    """
+    key = (site, path, tuple(sorted(params.items())))
+    cached = _cache_lookup(key, 'site')
+    if cached:
+        logger.debug("response_cache_hit", site=site, path=path)
+        return cached
+    
+    result = await pass_get(site, path, params)
+    digest = hashlib.sha1(orjson.dumps(result, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    etag = f'"{digest}"'
+    
+    _cache_store(key, result, etag)
+    return result, etag
+
+
+def _inserted_at(pair: Tuple[str, dict]) -> str:
+    """Merge key: ISO-8601 UTC timestamps sort lexicographically."""
+    return pair[1].get('inserted_at') or ''
+
+
+def _federated_params(params: dict) -> Tuple[dict, int]:
+    """
+    Resolve the global limit for a cross-site query.
+    
+    The limit is pushed down to every site: no site can contribute more
+    than `limit` items to the merged window.
+    
+    Args:
+        params: Query parameters from the client
+        
+    Returns:
+        Tuple of (parameters to forward, limit)
+        
+    Raises:
+        HTTPException: If the limit is not an integer
+    """
+    params = {**params, 'limit': params.get('limit') or str(config.query_default_limit)}
+    try:
+        return params, int(params['limit'])
+    except ValueError:
+        raise HTTPException(422, f"Invalid limit: {params['limit']}")
+
+
+async def _fetch_all_sites(path: str, params: dict) -> Tuple[list, list, dict]:
+    """
+    Query every configured site concurrently.
+    
+    Args:
+        path: API path to query
+        params: Query parameters forwarded to every site
+        
+    Returns:
+        Tuple of (per-site (site, item) streams, site ETags, errors by site)
+        
+    Raises:
+        HTTPException: If no site could be reached
+    """
+    sites = list(config.sites)
+    results = await asyncio.gather(
+        *(cached_get(site, path, params) for site in sites),
+        return_exceptions=True
+    )
+    
+    streams = []
+    etags = []
+    errors = {}
+    for site, result in zip(sites, results):
+        if isinstance(result, BaseException):
+            errors[site] = getattr(result, 'detail', None) or str(result)
+            continue
+        body, site_etag = result
+        # Pair items with their site in C rather than a generator frame per item
+        streams.append(zip(repeat(site), body.get('items', [])))
+        etags.append(site_etag)
+    
+    if not streams:
+        raise HTTPException(502, f'No site reachable: {errors}')
+    
+    return streams, etags, errors
+
+
+async def federated_get(path: str, params: dict) -> Tuple[dict, str]:
+    """
+    Run a query against every configured site and merge the results.
+    
+    Each Local API returns items newest-first by `inserted_at`, so the
+    per-site lists are combined with a streaming k-way merge and only the
+    first `limit` items are materialized. Queries without a limit use
+    `config.query_default_limit`.
+    
+    Args:
+        path: API path to query
+        params: Query parameters forwarded to every site
+        
+    Returns:
+        Tuple of (merged response body, ETag)
+        
+    Raises:
+        HTTPException: If the limit is invalid or no site could be reached
+    """
+    params, limit = _federated_params(params)
+    
+    # Repeat dashboard queries reuse the merged result as well as the
+    # per-site responses
+    key = ('*', path, tuple(sorted(params.items())))
+    cached = _cache_lookup(key, 'federated')
+    if cached:
+        return cached
+    
+    streams, etags, errors = await _fetch_all_sites(path, params)
+    merged = heapq.merge(*streams, key=_inserted_at, reverse=True)
+    items = [{**item, 'site': site} for site, item in islice(merged, limit)]
+    
+    logger.info(
+        "federated_query_completed",
+        path=path,
+        sites=len(config.sites),
+        failed_sites=len(errors),
+        count=len(items)
+    )
+    
+    etag = '"' + hashlib.sha1(''.join(etags).encode()).hexdigest() + '"'
+    body = {'items': items, 'count': len(items), 'errors': errors}
+    # Partial results are not cached so a recovered site shows up at once
+    if not errors:
+        _cache_store(key, body, etag)
+    return body, etag
+
+
+async def federated_stream(request: Request, path: str) -> StreamingResponse:
+    """
+    Stream a cross-site query as newline-delimited JSON.
+    
+    Items are encoded one at a time straight out of the k-way merge, so
+    the merged list and a single large JSON document are never built.
+    Unreachable sites are listed in the `X-Failed-Sites` header.
+    
+    Args:
+        request: Incoming request
+        path: API path to query
+        
+    Returns:
+        ndjson stream of items, newest first
+    """
+    params, limit = _federated_params(dict(request.query_params))
+    streams, _, errors = await _fetch_all_sites(path, params)
+    merged = islice(heapq.merge(*streams, key=_inserted_at, reverse=True), limit)
+    
+    async def ndjson():
+        for site, item in merged:
+            yield orjson.dumps({**item, 'site': site}) + b'\n'
+    
+    headers = {'X-Failed-Sites': ','.join(errors)} if errors else None
+    return StreamingResponse(ndjson(), media_type='application/x-ndjson', headers=headers)
+
+
+async def forward_query(request: Request, site: Optional[str], path: str) -> Response:
+    """
+    Forward the request's query and honour If-None-Match.
+    
+    Queries a single site when `site` is given, otherwise all sites.
+    
+    Args:
+        request: Incoming request
+        site: Site identifier, or None for every configured site
+        path: API path to query
+        
+    Returns:
+        JSON response with ETag, or 304 if the client copy is current
+    """
+    params = {k: v for k, v in request.query_params.items() if k != 'site'}
+    if site is None:
+        result, etag = await federated_get(path, params)
+    else:
+        result, etag = await cached_get(site, path, params)
+    headers = {'ETag': etag, 'Cache-Control': f'max-age={config.cache_ttl_s}'}
+    
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return JSONResponse(result, headers=headers)
+
+
 @app.get('/v1/jobs')
 @trace_async("get_jobs")
 async def jobs(
-    site: str = Query(..., description="Site identifier"),
-    **params
-) -> JSONResponse:
+    request: Request,
+    site: Optional[str] = Query(None, description="Site identifier (omit to query all sites)")
+) -> Response:
     """
-    Query jobs from a specific site.
+    Query jobs from one site or across all sites.
+    
+    Remaining query parameters are passed through to the local sites.
     
     Args:
-        site: Site identifier
-        **params: Additional query parameters passed to the local site
+        request: Incoming request
+        site: Site identifier, or None for every site
         
     Returns:
-        Jobs from the specified site
+        Jobs from the specified site, or merged newest-first across sites
     """
-    result = await pass_get(site, '/v1/jobs', params)
-    return JSONResponse(result)
+    return await forward_query(request, site, '/v1/jobs')
 
 
 @app.get('/v1/subjobs')
 @trace_async("get_subjobs")
 async def subjobs(
-    site: str = Query(..., description="Site identifier"),
-    **params
-) -> JSONResponse:
+    request: Request,
+    site: Optional[str] = Query(None, description="Site identifier (omit to query all sites)")
+) -> Response:
     """
-    Query subjobs from a specific site.
+    Query subjobs from one site or across all sites.
+    
+    Remaining query parameters are passed through to the local sites.
     
     Args:
-        site: Site identifier
-        **params: Additional query parameters passed to the local site
+        request: Incoming request
+        site: Site identifier, or None for every site
         
     Returns:
-        Subjobs from the specified site
+        Subjobs from the specified site, or merged newest-first across sites
     """
-    result = await pass_get(site, '/v1/subjobs', params)
-    return JSONResponse(result)
+    return await forward_query(request, site, '/v1/subjobs')
+
+
+@app.get('/v1/jobs:stream')
+async def jobs_stream(request: Request) -> StreamingResponse:
+    """
+    Stream jobs from all sites as ndjson, newest first.
+    
+    Query parameters are passed through to every local site.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        ndjson stream of jobs
+    """
+    return await federated_stream(request, '/v1/jobs')
+
+
+@app.get('/v1/subjobs:stream')
+async def subjobs_stream(request: Request) -> StreamingResponse:
+    """
+    Stream subjobs from all sites as ndjson, newest first.
+    
+    Query parameters are passed through to every local site.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        ndjson stream of subjobs
+    """
+    return await federated_stream(request, '/v1/subjobs')
 
 
 @app.get('/v1/sites')
@@ -182,28 +473,26 @@ async def healthz() -> JSONResponse:
     """
     Health check endpoint.
     
-    Also checks connectivity to all configured sites.
+    Also checks connectivity to all configured sites, concurrently.
     """
-    site_health = {}
-    
-    for site_id, base_url in config.sites.items():
+    async def check_site(base_url: str) -> dict:
         try:
-            async with httpx.AsyncClient() as client:
-                r = await client.get(
-                    f"{base_url}/v1/healthz",
-                    timeout=2.0
-                )
-                site_health[site_id] = {
-                    'status': 'ok' if r.status_code == 200 else 'degraded',
-                    'endpoint': base_url
-                }
+            r = await get_http_client().get(f"{base_url}/v1/healthz", timeout=2.0)
+            return {
+                'status': 'ok' if r.status_code == 200 else 'degraded',
+                'endpoint': base_url
+            }
         except Exception as e:
-            site_health[site_id] = {
+            return {
                 'status': 'unreachable',
                 'endpoint': base_url,
                 'error': str(e)
             }
     
+    # Probe all sites concurrently so latency is the slowest site, not the sum
+    statuses = await asyncio.gather(*(check_site(url) for url in config.sites.values()))
+    site_health = dict(zip(config.sites, statuses))
+    
     all_ok = all(s['status'] == 'ok' for s in site_health.values())
     
     return JSONResponse({
@@ -226,4 +515,4 @@ async def metrics_endpoint() -> Response:
 if __name__ == '__main__':
     import uvicorn
     logger.info("starting_central_api", sites=config.sites)
-    uvicorn.run(app, host='0.0.0.0', port=19000, log_config=None)
+    uvicorn.run(app, host='0.0.0.0', port=19000, log_config=None, loop='uvloop', http='httptools')
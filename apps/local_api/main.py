@@ -9,19 +9,23 @@ import asyncio
 import asyncpg
 import json
 import time
+import orjson
+from collections import defaultdict
 from fastapi import FastAPI, HTTPException, Query, Request, Response
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, List, Optional
 from datetime import datetime, timezone, timedelta
 
 # Import shared utilities
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+APPS_DIR = str(Path(__file__).parent.parent)
+if APPS_DIR not in sys.path:
+    sys.path.insert(0, APPS_DIR)
 from shared_utils import setup_logging, get_logger, setup_tracing, instrument_fastapi
 from shared_utils import MetricsCollector, get_metrics_collector, trace_async
-from shared_utils import LocalAPIConfig
+from shared_utils import LocalAPIConfig, ORJSONResponse
 
 # Configuration
 config = LocalAPIConfig()
@@ -42,7 +46,8 @@ metrics = get_metrics_collector(config.service_name)
 app = FastAPI(
     title='Local Site API',
     version='2.0.0',
-    description='Event ingestion and query service with TimescaleDB'
+    description='Event ingestion and query service with TimescaleDB',
+    default_response_class=ORJSONResponse
 )
 
 # Instrument with tracing
@@ -71,12 +76,74 @@ class SubjobResponse(BaseModel):
     count: int = Field(description="Number of items returned")
 
 
+EVENT_INSERT_SQL = """
+    INSERT INTO event(at, entity_type, entity_id, app_id, site_id, kind, payload, idempotency_key)
+    VALUES($1,$2,$3,$4,$5,$6,$7,$8)
+    ON CONFLICT (idempotency_key) DO NOTHING
+"""
+
+APP_INSERT_SQL = """
+    INSERT INTO app(app_id, name, version, site_id)
+    VALUES($1,$2,$3,$4)
+    ON CONFLICT (app_id) DO NOTHING
+"""
+
+# inserted_at is part of the job/subjob primary key. Stamp it per row with
+# clock_timestamp(): the column default now() is the transaction start time, so
+# two events for one entity written in the same batch transaction would collide.
+JOB_INSERT_SQL = """
+    INSERT INTO job(job_id, app_id, site_id, job_key, status, started_at, ended_at, duration_s,
+                     cpu_user_s, cpu_system_s, mem_max_mb, metadata, inserted_at)
+    VALUES($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,clock_timestamp())
+"""
+
+SUBJOB_INSERT_SQL = """
+    INSERT INTO subjob(subjob_id, job_id, app_id, site_id, sub_key, status, started_at, ended_at, duration_s,
+                       cpu_user_s, cpu_system_s, mem_max_mb, metadata, inserted_at)
+    VALUES($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,clock_timestamp())
+"""
+
+
+def _job_row(ev: IngestEvent, ev_metrics: dict) -> tuple:
+    """Build the job table row for an event."""
+    return (
+        ev.entity['id'], ev.app['app_id'], ev.site_id, ev.entity.get('business_key', ''),
+        ev.event.get('status', 'running'), ev.event.get('started_at'), ev.event.get('ended_at'),
+        ev_metrics.get('duration_s'),
+        ev_metrics.get('cpu_user_s', 0.0),
+        ev_metrics.get('cpu_system_s', 0.0),
+        ev_metrics.get('mem_max_mb', 0.0),
+        ev.event.get('metadata', {})
+    )
+
+
+def _subjob_row(ev: IngestEvent, ev_metrics: dict) -> tuple:
+    """Build the subjob table row for an event."""
+    return (
+        ev.entity['id'], ev.entity.get('parent_id'), ev.app['app_id'], ev.site_id,
+        ev.entity.get('sub_key', ''),
+        ev.event.get('status', 'running'), ev.event.get('started_at'), ev.event.get('ended_at'),
+        ev_metrics.get('duration_s'),
+        ev_metrics.get('cpu_user_s', 0.0),
+        ev_metrics.get('cpu_system_s', 0.0),
+        ev_metrics.get('mem_max_mb', 0.0),
+        ev.event.get('metadata', {})
+    )
+
+
+# Entity type -> (table, insert SQL, row builder)
+ENTITY_WRITERS = {
+    'job': ('job', JOB_INSERT_SQL, _job_row),
+    'subjob': ('subjob', SUBJOB_INSERT_SQL, _subjob_row),
+}
+
+
 @app.middleware("http")
 async def metrics_middleware(request: Request, call_next):
     """Middleware to collect HTTP metrics."""
-    start_time = time.time()
+    start_time = time.monotonic()
     response = await call_next(request)
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     
     metrics.record_http_request(
         method=request.method,
@@ -88,9 +155,51 @@ async def metrics_middleware(request: Request, call_next):
     return response
 
 
+def _encode_jsonb(value: Any) -> bytes:
+    """Encode a JSONB parameter in binary wire format: version byte, then JSON."""
+    return b'\x01' + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> str:
+    """Return JSONB columns as JSON text, as asyncpg does without a codec."""
+    return data[1:].decode()
+
+
+async def _init_connection(con: asyncpg.Connection) -> None:
+    """Encode JSONB parameters with orjson on every pooled connection."""
+    await con.set_type_codec(
+        'jsonb',
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema='pg_catalog',
+        format='binary'
+    )
+
+
+async def _create_pool(min_size: int, max_size: int) -> asyncpg.Pool:
+    """
+    Create a database connection pool with the shared connection settings.
+    
+    Args:
+        min_size: Connections opened up front
+        max_size: Maximum connections
+        
+    Returns:
+        Connection pool instance
+    """
+    return await asyncpg.create_pool(
+        config.database_url,
+        min_size=min_size,
+        max_size=max_size,
+        command_timeout=config.db_command_timeout_s,
+        max_inactive_connection_lifetime=config.db_max_inactive_connection_lifetime_s,
+        init=_init_connection
+    )
+
+
 async def get_pool() -> asyncpg.Pool:
     """
-    Get or create the database connection pool.
+    Get or create the database connection pool used for ingestion.
     
     Returns:
         Connection pool instance
@@ -101,11 +210,7 @@ async def get_pool() -> asyncpg.Pool:
             min_size=config.db_pool_min_size,
             max_size=config.db_pool_max_size
         )
-        app.state.pool = await asyncpg.create_pool(
-            config.database_url,
-            min_size=config.db_pool_min_size,
-            max_size=config.db_pool_max_size
-        )
+        app.state.pool = await _create_pool(config.db_pool_min_size, config.db_pool_max_size)
         logger.info("db_pool_created")
     
     # Update pool metrics
@@ -115,18 +220,42 @@ async def get_pool() -> asyncpg.Pool:
     return app.state.pool
 
 
+async def get_query_pool() -> asyncpg.Pool:
+    """
+    Get or create the database connection pool used for read queries.
+    
+    Queries run on their own pool so long scans and SSE clients cannot take
+    every connection away from ingestion. The pool is created by `startup()`.
+    
+    Returns:
+        Connection pool instance (the ingest pool if `db_query_pool_max_size` is 0)
+    """
+    if not config.db_query_pool_max_size:
+        return await get_pool()
+    if not hasattr(app.state, 'query_pool'):
+        logger.info("creating_db_query_pool", max_size=config.db_query_pool_max_size)
+        app.state.query_pool = await _create_pool(1, config.db_query_pool_max_size)
+        logger.info("db_query_pool_created")
+    return app.state.query_pool
+
+
 @app.on_event('startup')
 async def startup() -> None:
-    """Startup handler - initialize database pool."""
+    """Startup handler - initialize database pools."""
     logger.info("service_starting", database_url=config.database_url.split('@')[-1])
     await get_pool()
+    # Created here, before any request can race to create it
+    await get_query_pool()
     logger.info("service_started")
 
 
 @app.on_event('shutdown')
 async def shutdown() -> None:
-    """Shutdown handler - close database pool."""
+    """Shutdown handler - close database pools."""
     logger.info("service_shutting_down")
+    if hasattr(app.state, 'query_pool'):
+        await app.state.query_pool.close()
+        logger.info("db_query_pool_closed")
     if hasattr(app.state, 'pool'):
         await app.state.pool.close()
         logger.info("db_pool_closed")
@@ -134,7 +263,7 @@ async def shutdown() -> None:
 
 @app.post('/v1/ingest/events', response_model=dict)
 @trace_async("ingest_event")
-async def ingest(ev: IngestEvent) -> JSONResponse:
+async def ingest(ev: IngestEvent) -> ORJSONResponse:
     """
     Ingest a single monitoring event.
     
@@ -150,12 +279,27 @@ async def ingest(ev: IngestEvent) -> JSONResponse:
     Raises:
         HTTPException: If event validation or insertion fails
     """
-    start_time = time.time()
-    now = datetime.now(timezone.utc)
+    return await _ingest_event(ev, datetime.now(timezone.utc))
+
+
+def _prepare_event(ev: IngestEvent, now: datetime) -> tuple:
+    """
+    Validate one event and build the rows it writes.
     
+    Args:
+        ev: Event to ingest
+        now: Reference time for the skew check, shared across a batch
+        
+    Returns:
+        Tuple of (event row, app row, entity table, entity insert SQL, entity row)
+        
+    Raises:
+        HTTPException: If the timestamp, time skew, entity type or a required
+            field is invalid
+    """
     try:
         ev_at = datetime.fromisoformat(ev.event['at'])
-    except (KeyError, ValueError) as e:
+    except (KeyError, TypeError, ValueError) as e:
         logger.error("invalid_event_timestamp", error=str(e))
         raise HTTPException(status_code=422, detail='Invalid event timestamp')
     
@@ -169,87 +313,80 @@ async def ingest(ev: IngestEvent) -> JSONResponse:
         )
         raise HTTPException(status_code=422, detail=f'Event time skew too large: {skew}s')
     
+    writer = ENTITY_WRITERS.get(ev.entity.get('type'))
+    if writer is None:
+        logger.error("invalid_entity_type", entity_type=ev.entity.get('type'))
+        raise HTTPException(status_code=422, detail=f"Invalid entity type: {ev.entity.get('type')}")
+    table, insert_sql, build_row = writer
+    
+    try:
+        event_row = (
+            ev_at, ev.entity['type'], ev.entity['id'], ev.app['app_id'], ev.site_id,
+            ev.event['kind'], ev.event, ev.idempotency_key
+        )
+        app_row = (ev.app['app_id'], ev.app.get('name', ''), ev.app.get('version', ''), ev.site_id)
+        entity_row = build_row(ev, ev.event.get('metrics') or {})
+    except (KeyError, TypeError, AttributeError) as e:
+        logger.error("invalid_event_fields", error=str(e), idempotency_key=ev.idempotency_key)
+        raise HTTPException(status_code=422, detail=f'Missing or invalid event field: {e}')
+    return event_row, app_row, table, insert_sql, entity_row
+
+
+async def _ingest_event(ev: IngestEvent, now: datetime) -> ORJSONResponse:
+    """
+    Validate and store one event.
+    
+    Args:
+        ev: Event to ingest
+        now: Reference time for the skew check, shared across a batch
+        
+    Returns:
+        Success response
+        
+    Raises:
+        HTTPException: If event validation or insertion fails
+    """
+    start_time = time.monotonic()
+    event_row, app_row, table, insert_sql, entity_row = _prepare_event(ev, now)
     pool = await get_pool()
     
     try:
         async with pool.acquire() as con:
             async with con.transaction():
                 # Insert event
-                db_start = time.time()
-                await con.execute("""
-                    INSERT INTO event(at, entity_type, entity_id, app_id, site_id, kind, payload, idempotency_key)
-                    VALUES($1,$2,$3,$4,$5,$6,$7,$8)
-                    ON CONFLICT (idempotency_key) DO NOTHING
-                """, ev_at, ev.entity['type'], ev.entity['id'], ev.app['app_id'], ev.site_id,
-                     ev.event['kind'], json.dumps(ev.event), ev.idempotency_key)
+                db_start = time.monotonic()
+                await con.execute(EVENT_INSERT_SQL, *event_row)
                 
                 metrics.record_db_operation(
                     'insert',
                     'event',
                     'success',
-                    time.time() - db_start
+                    time.monotonic() - db_start
                 )
                 
                 # Insert app
-                db_start = time.time()
-                await con.execute("""
-                    INSERT INTO app(app_id, name, version, site_id)
-                    VALUES($1,$2,$3,$4)
-                    ON CONFLICT (app_id) DO NOTHING
-                """, ev.app['app_id'], ev.app.get('name', ''), ev.app.get('version', ''), ev.site_id)
+                db_start = time.monotonic()
+                await con.execute(APP_INSERT_SQL, *app_row)
                 
                 metrics.record_db_operation(
                     'insert',
                     'app',
                     'success',
-                    time.time() - db_start
+                    time.monotonic() - db_start
                 )
                 
                 # Insert job or subjob
-                if ev.entity['type'] == 'job':
-                    db_start = time.time()
-                    await con.execute("""
-                        INSERT INTO job(job_id, app_id, site_id, job_key, status, started_at, ended_at, duration_s,
-                                         cpu_user_s, cpu_system_s, mem_max_mb, metadata)
-                        VALUES($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12)
-                    """, ev.entity['id'], ev.app['app_id'], ev.site_id, ev.entity.get('business_key', ''),
-                         ev.event.get('status', 'running'),
-                         ev.event.get('started_at'), ev.event.get('ended_at'),
-                         (ev.event.get('metrics') or {}).get('duration_s'),
-                         (ev.event.get('metrics') or {}).get('cpu_user_s', 0.0),
-                         (ev.event.get('metrics') or {}).get('cpu_system_s', 0.0),
-                         (ev.event.get('metrics') or {}).get('mem_max_mb', 0.0),
-                         json.dumps(ev.event.get('metadata', {})))
-                    
-                    metrics.record_db_operation(
-                        'insert',
-                        'job',
-                        'success',
-                        time.time() - db_start
-                    )
-                else:
-                    db_start = time.time()
-                    await con.execute("""
-                        INSERT INTO subjob(subjob_id, job_id, app_id, site_id, sub_key, status, started_at, ended_at, duration_s,
-                                           cpu_user_s, cpu_system_s, mem_max_mb, metadata)
-                        VALUES($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13)
-                    """, ev.entity['id'], ev.entity.get('parent_id'), ev.app['app_id'], ev.site_id,
-                         ev.entity.get('sub_key', ''),
-                         ev.event.get('status', 'running'), ev.event.get('started_at'), ev.event.get('ended_at'),
-                         (ev.event.get('metrics') or {}).get('duration_s'),
-                         (ev.event.get('metrics') or {}).get('cpu_user_s', 0.0),
-                         (ev.event.get('metrics') or {}).get('cpu_system_s', 0.0),
-                         (ev.event.get('metrics') or {}).get('mem_max_mb', 0.0),
-                         json.dumps(ev.event.get('metadata', {})))
-                    
-                    metrics.record_db_operation(
-                        'insert',
-                        'subjob',
-                        'success',
-                        time.time() - db_start
-                    )
+                db_start = time.monotonic()
+                await con.execute(insert_sql, *entity_row)
+                
+                metrics.record_db_operation(
+                    'insert',
+                    table,
+                    'success',
+                    time.monotonic() - db_start
+                )
         
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         logger.info(
             "event_ingested",
             event_kind=ev.event['kind'],
@@ -258,7 +395,7 @@ async def ingest(ev: IngestEvent) -> JSONResponse:
             duration_s=round(duration, 4)
         )
         
-        return JSONResponse({'ok': True, 'duration_s': round(duration, 4)})
+        return ORJSONResponse({'ok': True, 'duration_s': round(duration, 4)})
     
     except Exception as e:
         logger.error(
@@ -271,30 +408,87 @@ async def ingest(ev: IngestEvent) -> JSONResponse:
         raise HTTPException(status_code=500, detail=f'Ingestion failed: {str(e)}')
 
 
+async def _insert_batch(prepared: List[tuple]) -> None:
+    """
+    Store prepared event rows in a single transaction.
+    
+    Each table gets one executemany call, so the batch costs a handful of
+    round-trips instead of three per event.
+    
+    Args:
+        prepared: Rows built by `_prepare_event`
+    """
+    entity_rows = defaultdict(list)
+    for _, _, table, insert_sql, entity_row in prepared:
+        entity_rows[(table, insert_sql)].append(entity_row)
+    statements = [
+        ('event', EVENT_INSERT_SQL, [p[0] for p in prepared]),
+        ('app', APP_INSERT_SQL, [p[1] for p in prepared]),
+    ] + [(table, sql, rows) for (table, sql), rows in entity_rows.items()]
+    
+    pool = await get_pool()
+    async with pool.acquire() as con:
+        async with con.transaction():
+            for table, sql, rows in statements:
+                db_start = time.monotonic()
+                await con.executemany(sql, rows)
+                metrics.record_db_operation(
+                    'insert',
+                    table,
+                    'success',
+                    time.monotonic() - db_start
+                )
+
+
 @app.post('/v1/ingest/events:batch', response_model=dict)
 @trace_async("ingest_batch")
-async def ingest_batch(events: List[IngestEvent]) -> JSONResponse:
+async def ingest_batch(events: List[IngestEvent]) -> ORJSONResponse:
     """
     Ingest a batch of events.
     
+    Valid events are written in one transaction. If that fails, each event
+    is retried in its own transaction so one bad row does not fail the rest.
+    
     Args:
         events: List of events to ingest
         
     Returns:
-        Response with ingestion statistics
+        Response with ingestion statistics and the idempotency keys of the
+        events that were not stored, so callers retry only those
     """
     logger.info("batch_ingestion_started", count=len(events))
     
-    success = 0
-    failed = 0
+    failed_keys = []
+    # One clock read for the whole batch; skew tolerance is minutes
+    now = datetime.now(timezone.utc)
     
+    valid = []
+    prepared = []
     for ev in events:
         try:
-            await ingest(ev)
-            success += 1
+            prepared.append(_prepare_event(ev, now))
+            valid.append(ev)
         except HTTPException:
-            failed += 1
+            failed_keys.append(ev.idempotency_key)
     
+    if prepared:
+        try:
+            await _insert_batch(prepared)
+        except Exception as e:
+            logger.warning(
+                "batch_insert_failed_retrying_per_event",
+                count=len(prepared),
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            for ev in valid:
+                try:
+                    await _ingest_event(ev, now)
+                except HTTPException:
+                    failed_keys.append(ev.idempotency_key)
+    
+    failed = len(failed_keys)
+    success = len(events) - failed
     logger.info(
         "batch_ingestion_completed",
         total=len(events),
@@ -302,11 +496,12 @@ async def ingest_batch(events: List[IngestEvent]) -> JSONResponse:
         failed=failed
     )
     
-    return JSONResponse({
+    return ORJSONResponse({
         'ok': True,
         'total': len(events),
         'success': success,
-        'failed': failed
+        'failed': failed,
+        'failed_keys': failed_keys
     })
 
 
@@ -318,7 +513,7 @@ async def get_jobs(
     status: Optional[str] = Query(None, description="Comma-separated status values"),
     app_name: Optional[str] = Query(None, description="Filter by app name (contains)"),
     limit: int = Query(config.query_default_limit, ge=1, le=config.query_max_limit, description="Result limit")
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Query jobs with filtering.
     
@@ -332,8 +527,8 @@ async def get_jobs(
     Returns:
         List of matching jobs
     """
-    start_time = time.time()
-    pool = await get_pool()
+    start_time = time.monotonic()
+    pool = await get_query_pool()
     
     clauses: List[str] = []
     params: List[any] = []
@@ -353,6 +548,15 @@ async def get_jobs(
     
     where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
     
+    name_filter = ""
+    if app_name:
+        params.append(f"%{app_name}%")
+        name_filter = f"AND a.name ILIKE ${len(params)}"
+    
+    # LIMIT is a bind parameter so the statement text, and with it asyncpg's
+    # per-connection prepared statement cache entry, does not vary per limit
+    params.append(limit)
+    
     sql = f'''
     WITH latest AS (
       SELECT j.*, ROW_NUMBER() OVER (PARTITION BY j.job_id ORDER BY j.inserted_at DESC) rn
@@ -363,36 +567,38 @@ async def get_jobs(
     FROM latest l
     JOIN app a ON a.app_id = l.app_id
     WHERE l.rn = 1
-    {'AND a.name ILIKE $' + str(len(params) + 1) if app_name else ''}
+    {name_filter}
     ORDER BY l.inserted_at DESC
-    LIMIT {int(limit)}
+    LIMIT ${len(params)}
     '''
     
-    if app_name:
-        params.append(f"%{app_name}%")
-    
     try:
-        db_start = time.time()
+        db_start = time.monotonic()
+        # Stream through a server-side cursor so only the prefetch window of
+        # Record objects is alive at once
         async with pool.acquire() as con:
-            rows = await con.fetch(sql, *params)
+            async with con.transaction(readonly=True):
+                items = [
+                    dict(r) async for r in con.cursor(
+                        sql, *params, prefetch=config.query_prefetch_rows
+                    )
+                ]
         
         metrics.record_db_operation(
             'select',
             'job',
             'success',
-            time.time() - db_start
+            time.monotonic() - db_start
         )
         
-        items = [dict(r) for r in rows]
-        
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         logger.info(
             "jobs_query_completed",
             count=len(items),
             duration_s=round(duration, 4)
         )
         
-        return JSONResponse({
+        return ORJSONResponse({
             'items': items,
             'count': len(items),
             'duration_s': round(duration, 4)
@@ -411,7 +617,7 @@ async def get_subjobs(
     to: Optional[str] = Query(None, alias='to', description="End timestamp (ISO 8601)"),
     status: Optional[str] = Query(None, description="Comma-separated status values"),
     limit: int = Query(config.query_default_limit, ge=1, le=config.query_max_limit, description="Result limit")
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Query subjobs with filtering.
     
@@ -424,8 +630,8 @@ async def get_subjobs(
     Returns:
         List of matching subjobs
     """
-    start_time = time.time()
-    pool = await get_pool()
+    start_time = time.monotonic()
+    pool = await get_query_pool()
     
     clauses: List[str] = []
     params: List[any] = []
@@ -445,6 +651,9 @@ async def get_subjobs(
     
     where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
     
+    # Bound rather than inlined, see get_jobs
+    params.append(limit)
+    
     sql = f'''
     WITH latest AS (
       SELECT s.*, ROW_NUMBER() OVER (PARTITION BY s.subjob_id ORDER BY s.inserted_at DESC) rn
@@ -453,31 +662,36 @@ async def get_subjobs(
     )
     SELECT * FROM latest WHERE rn = 1
     ORDER BY inserted_at DESC
-    LIMIT {int(limit)}
+    LIMIT ${len(params)}
     '''
     
     try:
-        db_start = time.time()
+        db_start = time.monotonic()
+        # Stream through a server-side cursor so only the prefetch window of
+        # Record objects is alive at once
         async with pool.acquire() as con:
-            rows = await con.fetch(sql, *params)
+            async with con.transaction(readonly=True):
+                items = [
+                    dict(r) async for r in con.cursor(
+                        sql, *params, prefetch=config.query_prefetch_rows
+                    )
+                ]
         
         metrics.record_db_operation(
             'select',
             'subjob',
             'success',
-            time.time() - db_start
+            time.monotonic() - db_start
         )
         
-        items = [dict(r) for r in rows]
-        
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         logger.info(
             "subjobs_query_completed",
             count=len(items),
             duration_s=round(duration, 4)
         )
         
-        return JSONResponse({'items': items, 'count': len(items), 'duration_s': round(duration, 4)})
+        return ORJSONResponse({'items': items, 'count': len(items), 'duration_s': round(duration, 4)})
     
     except Exception as e:
         logger.error("subjobs_query_failed", error=str(e))
@@ -494,7 +708,7 @@ async def stream() -> StreamingResponse:
         SSE stream of new events
     """
     async def event_gen():
-        pool = await get_pool()
+        pool = await get_query_pool()
         last = datetime.now(timezone.utc)
         logger.info("event_stream_started")
         
@@ -519,11 +733,11 @@ async def stream() -> StreamingResponse:
 
 
 @app.get('/v1/healthz')
-async def healthz() -> JSONResponse:
+async def healthz() -> ORJSONResponse:
     """Health check endpoint."""
     pool_ok = hasattr(app.state, 'pool')
     
-    return JSONResponse({
+    return ORJSONResponse({
         'status': 'ok' if pool_ok else 'degraded',
         'service': config.service_name,
         'version': '2.0.0',
@@ -542,4 +756,13 @@ async def metrics_endpoint() -> Response:
 
 if __name__ == '__main__':
     import uvicorn
-    uvicorn.run(app, host='0.0.0.0', port=18000, log_config=None)
+    # uvloop/httptools ship with uvicorn[standard]; request them explicitly
+    # so a missing extra fails at startup instead of silently falling back
+    uvicorn.run(
+        app,
+        host='0.0.0.0',
+        port=18000,
+        log_config=None,
+        loop='uvloop',
+        http='httptools'
+    )
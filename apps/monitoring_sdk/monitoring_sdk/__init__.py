@@ -1,10 +1,10 @@
 from .models import AppRef, EntityRef, EventPayload, JobEvent
-from .emitter import SidecarEmitter
+from .emitter import SidecarEmitter, BackgroundEmitter
 from .context import Monitored
 
 # AWS helpers are optional
 try:
     from . import aws_helpers
-    __all__ = ['AppRef','EntityRef','EventPayload','JobEvent','SidecarEmitter','Monitored','aws_helpers']
+    __all__ = ['AppRef','EntityRef','EventPayload','JobEvent','SidecarEmitter','BackgroundEmitter','Monitored','aws_helpers']
 except ImportError:
-    __all__ = ['AppRef','EntityRef','EventPayload','JobEvent','SidecarEmitter','Monitored']
+    __all__ = ['AppRef','EntityRef','EventPayload','JobEvent','SidecarEmitter','BackgroundEmitter','Monitored']
@@ -1,4 +1,5 @@
 import time
+import threading
 import psutil
 from contextlib import ContextDecorator
 from uuid import uuid4, UUID
@@ -41,7 +42,8 @@ class Monitored(ContextDecorator):
         parent_id: Optional[UUID] = None,
         emitter: Optional[SidecarEmitter] = None,
         metadata: Optional[Dict[str, Any]] = None,
-        enable_logging: bool = True
+        enable_logging: bool = True,
+        sample_interval_s: Optional[float] = None
     ):
         """
         Initialize the monitored context.
@@ -56,7 +58,15 @@ class Monitored(ContextDecorator):
             emitter: Optional custom emitter (defaults to new SidecarEmitter)
             metadata: Optional metadata dict to include in events
             enable_logging: Whether to log operations
+            sample_interval_s: If set, sample memory on a background thread
+                at this interval so `tick()` does not query psutil itself
+            
+        Raises:
+            ValueError: If sample_interval_s is set but not positive
         """
+        if sample_interval_s is not None and not sample_interval_s > 0:
+            raise ValueError(f"sample_interval_s must be positive, got {sample_interval_s!r}")
+        
         self.site_id = site_id
         self.app = app
         self.entity_id = uuid4()
@@ -74,14 +84,36 @@ class Monitored(ContextDecorator):
         self._cpu_t0: Optional[tuple[float, float]] = None
         self.mem_max_mb = 0.0
         self.enable_logging = enable_logging
+        self.sample_interval_s = sample_interval_s
+        self._sampler: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+    
+    def _sample_memory(self) -> None:
+        """Fold the current RSS into the peak memory reading."""
+        rss = self.proc.memory_info().rss / (1024 * 1024)
+        self.mem_max_mb = max(self.mem_max_mb, rss)
+    
+    def _sample_loop(self) -> None:
+        """Sample memory every `sample_interval_s` until the context exits."""
+        while not self._sampler_stop.wait(self.sample_interval_s):
+            try:
+                self._sample_memory()
+            except psutil.Error:
+                return
     
     def __enter__(self) -> 'Monitored':
         """Enter the monitored context and send 'started' event."""
         self._t0 = time.perf_counter()
         cpu = self.proc.cpu_times()
         self._cpu_t0 = (cpu.user, cpu.system)
-        rss = self.proc.memory_info().rss / (1024 * 1024)
-        self.mem_max_mb = max(self.mem_max_mb, rss)
+        self._sample_memory()
+        
+        if self.sample_interval_s:
+            self._sampler_stop.clear()
+            self._sampler = threading.Thread(
+                target=self._sample_loop, name='monitored-sampler', daemon=True
+            )
+            self._sampler.start()
         
         try:
             self.emitter.send(
@@ -124,8 +156,8 @@ class Monitored(ContextDecorator):
         Args:
             extra_meta: Optional additional metadata for this tick
         """
-        rss = self.proc.memory_info().rss / (1024 * 1024)
-        self.mem_max_mb = max(self.mem_max_mb, rss)
+        if self._sampler is None:
+            self._sample_memory()
         
         try:
             self.emitter.send(
@@ -155,12 +187,15 @@ class Monitored(ContextDecorator):
     
     def __exit__(self, exc_type, exc, tb):  # type: ignore
         """Exit the monitored context and send 'finished' event."""
+        if self._sampler is not None:
+            self._sampler_stop.set()
+            self._sampler.join()
+            self._sampler = None
         cpu = self.proc.cpu_times()
         cpu_user = cpu.user - self._cpu_t0[0] if self._cpu_t0 else 0.0
         cpu_sys = cpu.system - self._cpu_t0[1] if self._cpu_t0 else 0.0
         duration = time.perf_counter() - self._t0 if self._t0 else 0.0
-        rss = self.proc.memory_info().rss / (1024 * 1024)
-        self.mem_max_mb = max(self.mem_max_mb, rss)
+        self._sample_memory()
         status = 'failed' if exc else 'succeeded'
         
         metadata_final = dict(self.metadata)
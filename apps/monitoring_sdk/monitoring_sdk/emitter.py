@@ -1,6 +1,8 @@
 import os
+import queue
+import threading
 import httpx
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from .models import JobEvent
 
@@ -11,10 +13,34 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)  # type: ignore
 
+try:
+    import orjson
+
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def _jsonable(ev: JobEvent) -> object:
+        # orjson encodes the slotted dataclasses, UUIDs and aware datetimes
+        # natively, giving the same bytes as ev.to_json() without building
+        # the intermediate dicts
+        return ev
+except ImportError:
+    import json
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def _jsonable(ev: JobEvent) -> object:
+        return ev.to_json()
+
 DEFAULT_TIMEOUT = 5.0
 MAX_RETRIES = 3
 RETRY_MIN_WAIT = 0.1
 RETRY_MAX_WAIT = 2.0
+JSON_HEADERS = {'Content-Type': 'application/json'}
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_SEND_BATCH = 100
+_STOP = object()
 
 
 class SidecarEmitter:
@@ -26,6 +52,7 @@ class SidecarEmitter:
     - Automatic retries with exponential backoff
     - Structured logging of all operations
     - Connection pooling for better performance
+    - orjson encoding when available (falls back to stdlib json)
     - Graceful error handling with fallback options
     """
     
@@ -78,7 +105,9 @@ class SidecarEmitter:
                 entity_type=ev.entity.type,
                 entity_id=str(ev.entity.id)
             )
-            r = self._client.post('/v1/ingest/events', json=ev.to_json())
+            r = self._client.post(
+                '/v1/ingest/events', content=_dumps(_jsonable(ev)), headers=JSON_HEADERS
+            )
             r.raise_for_status()
             logger.info(
                 "event_sent",
@@ -115,8 +144,10 @@ class SidecarEmitter:
         event_list = list(events)
         try:
             logger.debug("sending_batch", count=len(event_list))
-            payload = [e.to_json() for e in event_list]
-            r = self._client.post('/v1/ingest/events:batch', json=payload)
+            payload = [_jsonable(e) for e in event_list]
+            r = self._client.post(
+                '/v1/ingest/events:batch', content=_dumps(payload), headers=JSON_HEADERS
+            )
             r.raise_for_status()
             logger.info(
                 "batch_sent",
@@ -145,3 +176,141 @@ class SidecarEmitter:
         """Context manager exit."""
         self.close()
         return False
+
+
+class BackgroundEmitter:
+    """
+    Non-blocking wrapper that sends events from a daemon thread.
+    
+    `send` only enqueues the event, so the calling job never waits on
+    encoding or the network. The sender thread drains whatever has queued
+    up and posts it as one batch. When the queue is full new events are
+    dropped and counted in `dropped` rather than blocking the caller.
+    
+    Example:
+        >>> with BackgroundEmitter() as emitter:
+        ...     with Monitored(site_id='fab1', app=app, entity_type='job', emitter=emitter):
+        ...         pass
+    """
+    
+    def __init__(
+        self,
+        emitter: Optional[SidecarEmitter] = None,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+        max_batch: int = DEFAULT_SEND_BATCH
+    ):
+        """
+        Initialize the emitter and start the sender thread.
+        
+        Args:
+            emitter: Emitter used by the sender thread (defaults to new SidecarEmitter)
+            max_queue: Maximum number of events waiting to be sent
+            max_batch: Maximum number of events per request
+        """
+        self.emitter = emitter or SidecarEmitter()
+        self.max_batch = max_batch
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        # Events handed to the emitter by the sender thread and not yet sent
+        self._in_flight = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name='monitoring-sdk-sender', daemon=True)
+        self._thread.start()
+    
+    def send(self, ev: JobEvent) -> None:
+        """
+        Queue a single event for sending.
+        
+        Args:
+            ev: JobEvent to send
+        """
+        try:
+            self._queue.put_nowait(ev)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+                dropped = self.dropped
+            logger.warning("event_dropped_queue_full", event_kind=ev.event.kind, dropped=dropped)
+    
+    def send_batch(self, events: Iterable[JobEvent]) -> None:
+        """
+        Queue several events for sending.
+        
+        Args:
+            events: Iterable of JobEvents to send
+        """
+        for ev in events:
+            self.send(ev)
+    
+    def _run(self) -> None:
+        """Sender loop: block for one event, then take whatever else is queued."""
+        while True:
+            ev = self._queue.get()
+            if ev is _STOP:
+                return
+            batch: List[JobEvent] = [ev]
+            stopping = False
+            while len(batch) < self.max_batch:
+                try:
+                    ev = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if ev is _STOP:
+                    stopping = True
+                    break
+                batch.append(ev)
+            
+            self._in_flight = len(batch)
+            try:
+                if len(batch) == 1:
+                    self.emitter.send(batch[0])
+                else:
+                    self.emitter.send_batch(batch)
+            except Exception as e:
+                logger.error(
+                    "background_send_failed",
+                    count=len(batch),
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+            self._in_flight = 0
+            if stopping:
+                return
+    
+    def close(self, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """
+        Send any queued events, stop the sender thread and close the emitter.
+        
+        If the sender thread is still busy after `timeout`, the emitter is
+        left open so its in-progress send can finish, and the events not yet
+        sent are logged as abandoned.
+        
+        Args:
+            timeout: Maximum time to wait for queued events to be sent
+        """
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+            stop_queued = True
+        except queue.Full:
+            stop_queued = False
+        else:
+            self._thread.join(timeout)
+        
+        if self._thread.is_alive():
+            # An unconsumed stop marker is still counted by qsize()
+            queued = max(0, self._queue.qsize() - stop_queued)
+            logger.warning(
+                "background_emitter_close_timeout",
+                abandoned=queued + self._in_flight
+            )
+            return
+        self.emitter.close()
+    
+    def __enter__(self) -> 'BackgroundEmitter':
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):  # type: ignore
+        """Context manager exit."""
+        self.close()
+        return False
@@ -7,13 +7,13 @@ from datetime import datetime, timezone
 EventKind = Literal['started','progress','metric','finished','error','canceled']
 EntityType = Literal['job','subjob']
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppRef:
     app_id: UUID
     name: str
     version: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityRef:
     type: EntityType
     id: UUID
@@ -21,7 +21,7 @@ class EntityRef:
     business_key: Optional[str]
     sub_key: Optional[str]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventPayload:
     kind: EventKind
     at: datetime
@@ -29,7 +29,7 @@ class EventPayload:
     status: str
     metadata: Dict[str, object]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobEvent:
     idempotency_key: UUID
     site_id: str
@@ -50,22 +50,21 @@ class JobEvent:
         )
 
     def to_json(self) -> Dict[str, object]:
-        def enc(v):
-            if isinstance(v, UUID): return str(v)
-            if isinstance(v, datetime): return v.isoformat()
-            return v
+        # Field types are fixed, so encode directly instead of dispatching on
+        # isinstance per value
+        app, entity, event = self.app, self.entity, self.event
         return {
-            "idempotency_key": enc(self.idempotency_key),
+            "idempotency_key": str(self.idempotency_key),
             "site_id": self.site_id,
-            "app": {"app_id": enc(self.app.app_id), "name": self.app.name, "version": self.app.version},
+            "app": {"app_id": str(app.app_id), "name": app.name, "version": app.version},
             "entity": {
-                "type": self.entity.type, "id": enc(self.entity.id),
-                "parent_id": enc(self.entity.parent_id) if self.entity.parent_id else None,
-                "business_key": self.entity.business_key, "sub_key": self.entity.sub_key
+                "type": entity.type, "id": str(entity.id),
+                "parent_id": str(entity.parent_id) if entity.parent_id else None,
+                "business_key": entity.business_key, "sub_key": entity.sub_key
             },
             "event": {
-                "kind": self.event.kind, "at": enc(self.event.at),
-                "metrics": self.event.metrics, "status": self.event.status,
-                "metadata": self.event.metadata
+                "kind": event.kind, "at": event.at.isoformat(),
+                "metrics": event.metrics, "status": event.status,
+                "metadata": event.metadata
             }
         }
@@ -1,9 +1,11 @@
-"""Shared utilities for logging, tracing, metrics, configuration, and alerting."""
+"""Shared utilities for logging, tracing, metrics, configuration, alerting, and responses."""
 from .logging import setup_logging, get_logger
 from .tracing import setup_tracing, trace_async, trace_sync, instrument_fastapi
 from .metrics import MetricsCollector, get_metrics_collector
 from .config import BaseServiceConfig, SidecarAgentConfig, LocalAPIConfig, CentralAPIConfig, ArchiverConfig
 from .alerts import AlertManager, Alert, AlertRule, AlertSeverity, AlertState, get_alert_manager
+from .responses import ORJSONResponse
+from .sidecar import EventSpool, install_size_guard
 
 __all__ = [
     'setup_logging',
@@ -25,5 +27,8 @@ __all__ = [
     'AlertSeverity',
     'AlertState',
     'get_alert_manager',
+    'ORJSONResponse',
+    'EventSpool',
+    'install_size_guard',
 ]
 
@@ -1,7 +1,9 @@
 """Alerting system with configurable thresholds and notifications."""
 import os
 import json
-from typing import Dict, List, Optional, Callable, Any
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Callable, Any
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
@@ -29,6 +31,16 @@ class AlertState(str, Enum):
     RESOLVED = "resolved"
 
 
+# Slack attachment colour per severity, keyed by the plain string value
+SLACK_COLORS: Dict[str, str] = {
+    AlertSeverity.INFO.value: '#36a64f',
+    AlertSeverity.WARNING.value: '#ff9900',
+    AlertSeverity.ERROR.value: '#ff0000',
+    AlertSeverity.CRITICAL.value: '#8b0000'
+}
+SLACK_DEFAULT_COLOR = '#808080'
+
+
 @dataclass
 class Alert:
     """Alert instance."""
@@ -74,14 +86,17 @@ class AlertManager:
     - Configurable alert rules
     - Multiple notification channels (webhook, email, Slack)
     - Alert cooldown to prevent spam
-    - Alert history tracking
+    - Bounded alert history tracking
     """
     
     def __init__(self):
         """Initialize alert manager."""
         self.rules: List[AlertRule] = []
         self.active_alerts: Dict[str, Alert] = {}
-        self.alert_history: List[Alert] = []
+        # Monotonic fire time per rule, so cooldowns ignore wall-clock jumps
+        self._fired_at: Dict[str, float] = {}
+        # Resolved alerts, oldest dropped first once ALERT_HISTORY_SIZE is reached
+        self.alert_history: Deque[Alert] = deque(maxlen=int(os.getenv('ALERT_HISTORY_SIZE', '1000')))
         self.webhook_url: Optional[str] = os.getenv('ALERT_WEBHOOK_URL')
         self.slack_webhook: Optional[str] = os.getenv('SLACK_WEBHOOK_URL')
         self.email_api: Optional[str] = os.getenv('EMAIL_API_URL')
@@ -178,6 +193,7 @@ class AlertManager:
         """
         new_alerts = []
         now = datetime.utcnow()
+        mono_now = time.monotonic()
         
         for rule in self.rules:
             try:
@@ -185,8 +201,7 @@ class AlertManager:
                 if rule.condition(metrics):
                     # Check cooldown
                     if rule.name in self.active_alerts:
-                        alert = self.active_alerts[rule.name]
-                        if (now - alert.started_at).total_seconds() < rule.cooldown_minutes * 60:
+                        if mono_now - self._fired_at[rule.name] < rule.cooldown_minutes * 60:
                             continue  # Still in cooldown
                     
                     # Create alert
@@ -203,6 +218,7 @@ class AlertManager:
                     )
                     
                     self.active_alerts[rule.name] = alert
+                    self._fired_at[rule.name] = mono_now
                     new_alerts.append(alert)
                     
                     logger.warning(
@@ -273,20 +289,15 @@ class AlertManager:
         """Send alert to Slack."""
         try:
             # Format Slack message
-            color = {
-                AlertSeverity.INFO: '#36a64f',
-                AlertSeverity.WARNING: '#ff9900',
-                AlertSeverity.ERROR: '#ff0000',
-                AlertSeverity.CRITICAL: '#8b0000'
-            }.get(alert.severity, '#808080')
+            severity = alert.severity.value
             
             payload = {
                 'attachments': [{
-                    'color': color,
+                    'color': SLACK_COLORS.get(severity, SLACK_DEFAULT_COLOR),
                     'title': f"🚨 Alert: {alert.name}",
                     'text': alert.message,
                     'fields': [
-                        {'title': 'Severity', 'value': alert.severity.value.upper(), 'short': True},
+                        {'title': 'Severity', 'value': severity.upper(), 'short': True},
                         {'title': 'State', 'value': alert.state.value.upper(), 'short': True},
                         {'title': 'Time', 'value': alert.started_at.strftime('%Y-%m-%d %H:%M:%S UTC'), 'short': False}
                     ],
@@ -307,10 +318,11 @@ class AlertManager:
     async def _send_email(self, alert: Alert) -> None:
         """Send alert via email."""
         try:
+            severity = alert.severity.value
             payload = {
-                'subject': f"Alert: {alert.name} ({alert.severity.value.upper()})",
+                'subject': f"Alert: {alert.name} ({severity.upper()})",
                 'body': alert.message,
-                'severity': alert.severity.value,
+                'severity': severity,
                 'alert': alert.to_dict()
             }
             
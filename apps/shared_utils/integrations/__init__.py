@@ -1,5 +1,5 @@
 """Integration adapters for multiple monitoring backends."""
-from .base import BaseIntegration, IntegrationConfig
+from .base import BaseIntegration, IntegrationConfig, IntegrationType
 from .local_api import LocalAPIIntegration
 from .zabbix import ZabbixIntegration
 from .elk import ELKIntegration
@@ -13,6 +13,7 @@ from .container import IntegrationContainer, get_container
 __all__ = [
     'BaseIntegration',
     'IntegrationConfig',
+    'IntegrationType',
     'LocalAPIIntegration',
     'ZabbixIntegration',
     'ELKIntegration',
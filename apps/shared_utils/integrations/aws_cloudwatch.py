@@ -2,7 +2,7 @@
 import boto3
 from typing import Dict, Any, List
 from datetime import datetime
-from .base import BaseIntegration, IntegrationConfig
+from .base import BaseIntegration, IntegrationConfig, EMPTY_MAPPING
 
 try:
     import structlog
@@ -32,6 +32,17 @@ class AWSCloudWatchIntegration(BaseIntegration):
         - instance_id: EC2 instance ID or ECS task ID (optional)
     """
     
+    # Job statuses logged at INFO; anything else is logged as ERROR
+    INFO_STATUSES = frozenset(('succeeded', 'running'))
+    
+    # (event metric key, CloudWatch metric name, unit)
+    METRIC_SPECS = (
+        ('duration_s', 'JobDuration', 'Seconds'),
+        ('cpu_user_s', 'CPUUserTime', 'Seconds'),
+        ('cpu_system_s', 'CPUSystemTime', 'Seconds'),
+        ('mem_max_mb', 'MemoryMaxMB', 'Megabytes'),
+    )
+    
     def __init__(self, config: IntegrationConfig):
         """Initialize AWS CloudWatch integration."""
         super().__init__(config)
@@ -45,6 +56,11 @@ class AWSCloudWatchIntegration(BaseIntegration):
         self.aws_access_key = self.get_config('aws_access_key_id')
         self.aws_secret_key = self.get_config('aws_secret_access_key')
         
+        # Dimensions that are the same for every datapoint from this process
+        self._static_dimensions = [{'Name': 'ComputePlatform', 'Value': self.compute_platform}]
+        if self.instance_id:
+            self._static_dimensions.append({'Name': 'InstanceId', 'Value': self.instance_id})
+        
         self.cloudwatch_client = None
         self.logs_client = None
         self.log_stream_name = None
@@ -101,74 +117,47 @@ class AWSCloudWatchIntegration(BaseIntegration):
         Returns:
             List of CloudWatch metric data
         """
-        entity = event.get('entity', {})
-        event_data = event.get('event', {})
-        metrics_data = event_data.get('metrics', {})
-        app = event.get('app', {})
+        entity = event.get('entity', EMPTY_MAPPING)
+        event_data = event.get('event', EMPTY_MAPPING)
+        metrics_data = event_data.get('metrics', EMPTY_MAPPING)
+        app = event.get('app', EMPTY_MAPPING)
+        finished = event_data.get('kind') == 'finished'
+        present = [spec for spec in self.METRIC_SPECS if spec[0] in metrics_data]
+        if not finished and not present:
+            return []
+        # Parsed once for all datapoints, and only when there are any
+        timestamp = datetime.fromisoformat(event_data.get('at'))
         
         # Base dimensions
         dimensions = [
             {'Name': 'SiteId', 'Value': event.get('site_id', 'unknown')},
             {'Name': 'AppName', 'Value': app.get('name', 'unknown')},
             {'Name': 'EntityType', 'Value': entity.get('type', 'unknown')},
-            {'Name': 'ComputePlatform', 'Value': self.compute_platform}
+            *self._static_dimensions
         ]
         
-        # Add instance/task ID if available
-        if self.instance_id:
-            dimensions.append({'Name': 'InstanceId', 'Value': self.instance_id})
-        
         # Create metrics
         cw_metrics = []
         
         # Job status metric
-        if event_data.get('kind') == 'finished':
+        if finished:
             status = event_data.get('status', 'unknown')
             cw_metrics.append({
                 'MetricName': 'JobCompleted',
                 'Dimensions': dimensions + [{'Name': 'Status', 'Value': status}],
                 'Value': 1,
                 'Unit': 'Count',
-                'Timestamp': datetime.fromisoformat(event_data.get('at'))
-            })
-        
-        # Duration metric
-        if 'duration_s' in metrics_data:
-            cw_metrics.append({
-                'MetricName': 'JobDuration',
-                'Dimensions': dimensions,
-                'Value': metrics_data['duration_s'],
-                'Unit': 'Seconds',
-                'Timestamp': datetime.fromisoformat(event_data.get('at'))
-            })
-        
-        # CPU metrics
-        if 'cpu_user_s' in metrics_data:
-            cw_metrics.append({
-                'MetricName': 'CPUUserTime',
-                'Dimensions': dimensions,
-                'Value': metrics_data['cpu_user_s'],
-                'Unit': 'Seconds',
-                'Timestamp': datetime.fromisoformat(event_data.get('at'))
-            })
-        
-        if 'cpu_system_s' in metrics_data:
-            cw_metrics.append({
-                'MetricName': 'CPUSystemTime',
-                'Dimensions': dimensions,
-                'Value': metrics_data['cpu_system_s'],
-                'Unit': 'Seconds',
-                'Timestamp': datetime.fromisoformat(event_data.get('at'))
+                'Timestamp': timestamp
             })
         
-        # Memory metric
-        if 'mem_max_mb' in metrics_data:
+        # Per-metric datapoints for whichever measurements are present
+        for source_key, metric_name, unit in present:
             cw_metrics.append({
-                'MetricName': 'MemoryMaxMB',
+                'MetricName': metric_name,
                 'Dimensions': dimensions,
-                'Value': metrics_data['mem_max_mb'],
-                'Unit': 'Megabytes',
-                'Timestamp': datetime.fromisoformat(event_data.get('at'))
+                'Value': metrics_data[source_key],
+                'Unit': unit,
+                'Timestamp': timestamp
             })
         
         return cw_metrics
@@ -183,15 +172,15 @@ class AWSCloudWatchIntegration(BaseIntegration):
         Returns:
             CloudWatch log event
         """
-        entity = event.get('entity', {})
-        event_data = event.get('event', {})
+        entity = event.get('entity', EMPTY_MAPPING)
+        event_data = event.get('event', EMPTY_MAPPING)
         
         # Create structured log message
         log_message = {
             'timestamp': event_data.get('at'),
-            'level': 'INFO' if event_data.get('status') in ['succeeded', 'running'] else 'ERROR',
+            'level': 'INFO' if event_data.get('status') in self.INFO_STATUSES else 'ERROR',
             'site_id': event.get('site_id'),
-            'app': event.get('app', {}).get('name'),
+            'app': event.get('app', EMPTY_MAPPING).get('name'),
             'entity_type': entity.get('type'),
             'entity_id': entity.get('id'),
             'event_kind': event_data.get('kind'),
@@ -1,9 +1,12 @@
 """AWS X-Ray integration for distributed tracing."""
+import os
+import json
 import boto3
 import time
-from typing import Dict, Any, List
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from .base import BaseIntegration, IntegrationConfig
+from .base import BaseIntegration, IntegrationConfig, EMPTY_MAPPING
 
 try:
     import structlog
@@ -24,6 +27,8 @@ class AWSXRayIntegration(BaseIntegration):
         - service_name: Service name for traces
         - aws_access_key_id: Optional AWS access key
         - aws_secret_access_key: Optional AWS secret key
+        - max_pending_segments: Started jobs held awaiting their finish event (default: 10000)
+        - pending_segment_ttl_s: Drop a started job not finished within this time (default: 86400)
     """
     
     def __init__(self, config: IntegrationConfig):
@@ -34,8 +39,12 @@ class AWSXRayIntegration(BaseIntegration):
         self.aws_access_key = self.get_config('aws_access_key_id')
         self.aws_secret_key = self.get_config('aws_secret_access_key')
         
+        self.max_pending_segments = int(self.get_config('max_pending_segments', 10000))
+        self.pending_segment_ttl_s = float(self.get_config('pending_segment_ttl_s', 86400))
+        
         self.xray_client = None
-        self.pending_segments = {}
+        # entity_id -> (monotonic start, segment), oldest first
+        self.pending_segments: Dict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
     
     async def initialize(self) -> None:
         """Initialize X-Ray client."""
@@ -56,16 +65,57 @@ class AWSXRayIntegration(BaseIntegration):
         )
     
     def _create_trace_id(self) -> str:
-        """Generate X-Ray trace ID."""
-        import random
-        hex_time = hex(int(time.time()))[2:]
-        hex_random = format(random.getrandbits(96), 'x')
-        return f"1-{hex_time}-{hex_random}"
+        """Generate X-Ray trace ID (8 hex digits of epoch time, 24 random)."""
+        return f"1-{int(time.time()):08x}-{os.urandom(12).hex()}"
     
     def _create_segment_id(self) -> str:
-        """Generate X-Ray segment ID."""
-        import random
-        return format(random.getrandbits(64), 'x')
+        """Generate X-Ray segment ID (16 random hex digits)."""
+        return os.urandom(8).hex()
+    
+    def _hold_segment(self, entity_id: str, segment: Dict[str, Any]) -> None:
+        """
+        Keep a started segment until its finish event arrives.
+        
+        Segments whose finish event never comes are evicted once they outlive
+        `pending_segment_ttl_s` or the table exceeds `max_pending_segments`,
+        oldest first.
+        
+        Args:
+            entity_id: Job or subjob ID
+            segment: In-progress segment document
+        """
+        now = time.monotonic()
+        # Re-insert so a restarted entity moves to the young end
+        self.pending_segments.pop(entity_id, None)
+        self.pending_segments[entity_id] = (now, segment)
+        
+        expired = 0
+        cutoff = now - self.pending_segment_ttl_s
+        while self.pending_segments:
+            started, _ = next(iter(self.pending_segments.values()))
+            if started >= cutoff and len(self.pending_segments) <= self.max_pending_segments:
+                break
+            self.pending_segments.popitem(last=False)
+            expired += 1
+        if expired:
+            logger.warning(
+                "xray_pending_segments_evicted",
+                count=expired,
+                pending=len(self.pending_segments)
+            )
+    
+    def _take_segment(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Remove and return the pending segment for an entity.
+        
+        Args:
+            entity_id: Job or subjob ID
+            
+        Returns:
+            The in-progress segment, or None if none is pending
+        """
+        held = self.pending_segments.pop(entity_id, None)
+        return held[1] if held else None
     
     def _event_to_xray_segment(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -77,14 +127,15 @@ class AWSXRayIntegration(BaseIntegration):
         Returns:
             X-Ray segment document
         """
-        entity = event.get('entity', {})
-        event_data = event.get('event', {})
-        metrics_data = event_data.get('metrics', {})
-        app = event.get('app', {})
+        entity = event.get('entity', EMPTY_MAPPING)
+        event_data = event.get('event', EMPTY_MAPPING)
+        metrics_data = event_data.get('metrics', EMPTY_MAPPING)
+        app = event.get('app', EMPTY_MAPPING)
         entity_id = entity.get('id')
+        kind = event_data.get('kind')
         
         # Check if this is start or end of trace
-        if event_data.get('kind') == 'started':
+        if kind == 'started':
             # Start new segment
             trace_id = self._create_trace_id()
             segment_id = self._create_segment_id()
@@ -111,25 +162,26 @@ class AWSXRayIntegration(BaseIntegration):
             }
             
             # Store pending segment
-            self.pending_segments[entity_id] = segment
+            self._hold_segment(entity_id, segment)
             return None  # Don't send yet
         
-        elif event_data.get('kind') == 'finished':
+        elif kind == 'finished':
             # Complete segment
-            if entity_id in self.pending_segments:
-                segment = self.pending_segments.pop(entity_id)
+            segment = self._take_segment(entity_id)
+            if segment is not None:
                 segment['end_time'] = datetime.fromisoformat(event_data.get('at')).timestamp()
                 segment['in_progress'] = False
                 
                 # Add status
                 status = event_data.get('status')
                 if status == 'failed':
+                    ev_metadata = event_data.get('metadata') or EMPTY_MAPPING
                     segment['error'] = True
                     segment['fault'] = True
                     segment['cause'] = {
                         'exceptions': [{
-                            'message': event_data.get('metadata', {}).get('error', 'Unknown error'),
-                            'type': event_data.get('metadata', {}).get('error_type', 'Error')
+                            'message': ev_metadata.get('error', 'Unknown error'),
+                            'type': ev_metadata.get('error_type', 'Error')
                         }]
                     }
                 
@@ -160,7 +212,6 @@ class AWSXRayIntegration(BaseIntegration):
             segment = self._event_to_xray_segment(event)
             
             if segment:
-                import json
                 segment_document = json.dumps(segment)
                 
                 self.xray_client.put_trace_segments(
@@ -199,7 +250,6 @@ class AWSXRayIntegration(BaseIntegration):
             return {'success': len(events), 'failed': 0}
         
         try:
-            import json
             segment_documents = [json.dumps(seg) for seg in segments]
             
             # X-Ray accepts up to 50 segments per request
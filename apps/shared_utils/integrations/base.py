@@ -1,10 +1,43 @@
 """Base integration interface and configuration."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Mapping, Optional
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Shared read-only default for nested-field lookups on incoming events, so
+# `event.get('entity', EMPTY_MAPPING)` does not allocate a dict per call.
+# Never hand it to a serializer: json/orjson do not accept mappingproxy.
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Length of each file rotation period. UTC hours and days start on exact
+# multiples of these from the epoch, so `int(time.time() // period)`
+# changes exactly when the rotated filename does.
+ROTATION_PERIODS_S: Dict[str, int] = {'hourly': 3600, 'daily': 86400}
+
+
+async def run_blocking_write(func: Callable[..., None], *args: Any) -> None:
+    """
+    Run a blocking file write in the default thread executor.
+    
+    The thread cannot be interrupted, so a cancelled caller still waits for
+    the write to finish before the cancellation propagates. A caller holding
+    a lock therefore keeps it until the file is no longer being written.
+    
+    Args:
+        func: Synchronous write function
+        *args: Arguments for func
+    """
+    write = asyncio.get_running_loop().run_in_executor(None, func, *args)
+    try:
+        await asyncio.shield(write)
+    except asyncio.CancelledError:
+        await asyncio.wait({write})
+        raise
+
+
 class IntegrationType(str, Enum):
     """Types of integrations."""
     LOCAL_API = "local_api"
@@ -37,6 +70,12 @@ class BaseIntegration(ABC):
     All integration adapters must implement this interface.
     """
     
+    # Whether the container may cancel a call that exceeds its timeout.
+    # Local file sinks opt out: their writes run in a thread that cannot be
+    # stopped, so a cancelled write would still land and then be spooled
+    # and delivered a second time.
+    cancel_on_timeout: bool = True
+    
     def __init__(self, config: IntegrationConfig):
         """
         Initialize the integration.
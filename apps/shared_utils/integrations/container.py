@@ -1,7 +1,8 @@
 """Dependency injection container for integrations."""
 import os
 import json
-from typing import Dict, List, Optional, Type
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional, Type
 from .base import BaseIntegration, IntegrationConfig, IntegrationType
 from .local_api import LocalAPIIntegration
 from .zabbix import ZabbixIntegration
@@ -29,6 +30,7 @@ class IntegrationContainer:
     - Configuration from environment or code
     - Lifecycle management (init, close)
     - Health checks across all integrations
+    - Concurrent fan-out with a per-integration timeout and concurrency cap
     """
     
     # Registry of available integration classes
@@ -43,9 +45,28 @@ class IntegrationContainer:
         IntegrationType.AWS_XRAY: AWSXRayIntegration,
     }
     
-    def __init__(self):
-        """Initialize the container."""
+    def __init__(
+        self,
+        integration_timeout_s: Optional[float] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize the container.
+        
+        Args:
+            integration_timeout_s: Maximum time a single integration may take to
+                handle an event or batch (defaults to INTEGRATION_TIMEOUT_S env var)
+            max_concurrency: Maximum calls in flight per integration; further
+                calls wait their turn (defaults to INTEGRATION_MAX_CONCURRENCY env var)
+        """
         self.integrations: Dict[str, BaseIntegration] = {}
+        self.integration_timeout_s = integration_timeout_s or float(
+            os.getenv('INTEGRATION_TIMEOUT_S', '10.0')
+        )
+        self.max_concurrency = max_concurrency or int(
+            os.getenv('INTEGRATION_MAX_CONCURRENCY', '32')
+        )
+        self._limits: Dict[str, asyncio.Semaphore] = {}
         self._initialized = False
     
     def register(self, config: IntegrationConfig) -> None:
@@ -152,9 +173,81 @@ class IntegrationContainer:
         self._initialized = True
         logger.info("all_integrations_initialized")
     
+    async def _fan_out(self, calls: Dict[str, Awaitable[Any]]) -> Dict[str, Any]:
+        """
+        Await one call per integration concurrently.
+        
+        Each call is bounded by `integration_timeout_s` so a single slow
+        backend cannot hold up the others, and by the integration's
+        concurrency cap so concurrent requests cannot pile unbounded work
+        onto one backend. Integrations with `cancel_on_timeout` unset, the
+        local file sinks, are only bounded by the cap.
+        
+        Args:
+            calls: Mapping of integration name to pending call
+            
+        Returns:
+            Mapping of integration name to result or raised exception
+        """
+        if not calls:
+            return {}
+        
+        results = await asyncio.gather(
+            *(self._limited(name, call) for name, call in calls.items()),
+            return_exceptions=True
+        )
+        return dict(zip(calls, results))
+    
+    async def _limited(self, name: str, call: Awaitable[Any]) -> Any:
+        """
+        Await one integration call within its concurrency cap and timeout.
+        
+        Time spent queued behind the cap counts against the timeout, so a
+        hung backend cannot stretch a fan-out beyond `integration_timeout_s`.
+        
+        Args:
+            name: Integration name
+            call: Pending call
+            
+        Returns:
+            Result of the call
+        """
+        limit = self._limits.get(name)
+        if limit is None:
+            limit = self._limits[name] = asyncio.Semaphore(self.max_concurrency)
+        integration = self.integrations.get(name)
+        timeout = self.integration_timeout_s
+        if integration is not None and not integration.cancel_on_timeout:
+            timeout = None
+        return await asyncio.wait_for(self._call_when_free(limit, call), timeout=timeout)
+    
+    @staticmethod
+    async def _call_when_free(limit: asyncio.Semaphore, call: Awaitable[Any]) -> Any:
+        """
+        Await call once a slot under limit is free.
+        
+        Args:
+            limit: Concurrency cap of the integration
+            call: Pending call
+            
+        Returns:
+            Result of the call
+        """
+        try:
+            await limit.acquire()
+        except BaseException:
+            # Timed out while queued: the call never started
+            if asyncio.iscoroutine(call):
+                call.close()
+            raise
+        try:
+            return await call
+        finally:
+            limit.release()
+    
     async def send_event(self, event: Dict) -> Dict[str, bool]:
         """
-        Send event to all enabled integrations.
+        Send event to all enabled integrations concurrently.
         
         Args:
             event: Event dictionary
@@ -162,28 +255,29 @@ class IntegrationContainer:
         Returns:
             Dictionary mapping integration name to success status
         """
-        results = {}
+        outcomes = await self._fan_out({
+            name: integration.send_event(event)
+            for name, integration in self.integrations.items()
+            if integration.is_enabled()
+        })
         
-        for name, integration in self.integrations.items():
-            if not integration.is_enabled():
-                continue
-            
-            try:
-                success = await integration.send_event(event)
-                results[name] = success
-            except Exception as e:
+        results = {}
+        for name, outcome in outcomes.items():
+            if isinstance(outcome, BaseException):
                 logger.error(
                     "integration_send_failed",
                     integration=name,
-                    error=str(e)
+                    error=str(outcome) or type(outcome).__name__
                 )
                 results[name] = False
+            else:
+                results[name] = outcome
         
         return results
     
     async def send_batch(self, events: List[Dict]) -> Dict[str, Dict[str, int]]:
         """
-        Send batch of events to all enabled integrations.
+        Send batch of events to all enabled integrations concurrently.
         
         Args:
             events: List of event dictionaries
@@ -191,44 +285,48 @@ class IntegrationContainer:
         Returns:
             Dictionary mapping integration name to result stats
         """
-        results = {}
+        outcomes = await self._fan_out({
+            name: integration.send_batch(events)
+            for name, integration in self.integrations.items()
+            if integration.is_enabled()
+        })
         
-        for name, integration in self.integrations.items():
-            if not integration.is_enabled():
-                continue
-            
-            try:
-                result = await integration.send_batch(events)
-                results[name] = result
-            except Exception as e:
+        results = {}
+        for name, outcome in outcomes.items():
+            if isinstance(outcome, BaseException):
                 logger.error(
                     "integration_batch_failed",
                     integration=name,
-                    error=str(e)
+                    error=str(outcome) or type(outcome).__name__
                 )
                 results[name] = {'success': 0, 'failed': len(events)}
+            else:
+                results[name] = outcome
         
         return results
     
     async def health_check_all(self) -> Dict[str, Dict]:
         """
-        Run health checks on all integrations.
+        Run health checks on all integrations concurrently.
         
         Returns:
             Dictionary mapping integration name to health status
         """
-        results = {}
+        outcomes = await self._fan_out({
+            name: integration.health_check()
+            for name, integration in self.integrations.items()
+        })
         
-        for name, integration in self.integrations.items():
-            try:
-                health = await integration.health_check()
-                results[name] = health
-            except Exception as e:
+        results = {}
+        for name, outcome in outcomes.items():
+            if isinstance(outcome, BaseException):
                 results[name] = {
                     'status': 'error',
                     'integration': name,
-                    'error': str(e)
+                    'error': str(outcome) or type(outcome).__name__
                 }
+            else:
+                results[name] = outcome
         
         return results
     
@@ -248,6 +346,7 @@ class IntegrationContainer:
                 )
         
         self.integrations.clear()
+        self._limits.clear()
         self._initialized = False
         logger.info("all_integrations_closed")
     
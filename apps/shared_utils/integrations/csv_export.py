@@ -1,11 +1,14 @@
 """CSV export integration for local file storage."""
 import csv
 import os
+import time
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import asyncio
-from .base import BaseIntegration, IntegrationConfig
+from .base import (
+    BaseIntegration, IntegrationConfig, EMPTY_MAPPING, ROTATION_PERIODS_S, run_blocking_write
+)
 
 try:
     import structlog
@@ -28,6 +31,8 @@ class CSVExportIntegration(BaseIntegration):
         - delimiter: CSV delimiter (default: ,)
     """
     
+    cancel_on_timeout = False
+    
     def __init__(self, config: IntegrationConfig):
         """Initialize CSV export integration."""
         super().__init__(config)
@@ -36,6 +41,9 @@ class CSVExportIntegration(BaseIntegration):
         self.include_headers = self.get_config('include_headers', True)
         self.delimiter = self.get_config('delimiter', ',')
         self._lock = asyncio.Lock()
+        # Current rotated filename and the rotation period it belongs to
+        self._filename: Optional[Path] = None
+        self._filename_key: Optional[int] = None
     
     async def initialize(self) -> None:
         """Create output directory if it doesn't exist."""
@@ -49,9 +57,18 @@ class CSVExportIntegration(BaseIntegration):
         )
     
     def _get_csv_filename(self) -> Path:
-        """Get current CSV filename based on rotation strategy."""
-        now = datetime.utcnow()
+        """
+        Get current CSV filename based on rotation strategy.
+        
+        The path is cached and only rebuilt when the rotation period rolls over.
+        """
+        now_s = time.time()
+        period = ROTATION_PERIODS_S.get(self.rotation)
+        key = int(now_s // period) if period else None
+        if self._filename is not None and key == self._filename_key:
+            return self._filename
         
+        now = datetime.utcfromtimestamp(now_s)
         if self.rotation == 'hourly':
             suffix = now.strftime('%Y%m%d_%H')
         elif self.rotation == 'daily':
@@ -59,15 +76,17 @@ class CSVExportIntegration(BaseIntegration):
         else:
             suffix = 'events'
         
-        return self.output_dir / f'wafer_events_{suffix}.csv'
+        self._filename = self.output_dir / f'wafer_events_{suffix}.csv'
+        self._filename_key = key
+        return self._filename
     
     def _flatten_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """Flatten nested event structure for CSV."""
-        entity = event.get('entity', {})
-        event_data = event.get('event', {})
-        metrics = event_data.get('metrics', {})
-        app = event.get('app', {})
-        metadata = event_data.get('metadata', {})
+        entity = event.get('entity', EMPTY_MAPPING)
+        event_data = event.get('event', EMPTY_MAPPING)
+        metrics = event_data.get('metrics', EMPTY_MAPPING)
+        app = event.get('app', EMPTY_MAPPING)
+        metadata = event_data.get('metadata', EMPTY_MAPPING)
         
         return {
             'timestamp': event_data.get('at'),
@@ -99,9 +118,9 @@ class CSVExportIntegration(BaseIntegration):
                 
                 flattened = self._flatten_event(event)
                 
-                # Use thread executor for file I/O
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
+                # Use thread executor for file I/O; the write runs to
+                # completion even if this call is cancelled
+                await run_blocking_write(
                     self._write_csv_sync,
                     filename,
                     flattened,
@@ -135,9 +154,9 @@ class CSVExportIntegration(BaseIntegration):
                 
                 flattened_events = [self._flatten_event(e) for e in events]
                 
-                # Use thread executor for file I/O
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
+                # Use thread executor for file I/O; the write runs to
+                # completion even if this call is cancelled
+                await run_blocking_write(
                     self._write_csv_batch_sync,
                     filename,
                     flattened_events,
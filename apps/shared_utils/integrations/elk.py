@@ -3,7 +3,7 @@ import httpx
 import json
 from typing import Dict, Any, List
 from datetime import datetime
-from .base import BaseIntegration, IntegrationConfig
+from .base import BaseIntegration, IntegrationConfig, EMPTY_MAPPING
 
 try:
     import structlog
@@ -13,6 +13,10 @@ except ImportError:
     logger = logging.getLogger(__name__)  # type: ignore
 
 
+# Elasticsearch statuses for a stored document
+ES_OK_STATUSES = frozenset((200, 201))
+
+
 class ELKIntegration(BaseIntegration):
     """
     Integration with Elasticsearch/ELK stack.
@@ -25,6 +29,12 @@ class ELKIntegration(BaseIntegration):
         - username: Optional basic auth username
         - password: Optional basic auth password
         - api_key: Optional API key
+        - number_of_shards: Primary shards per daily index (default: 1)
+        - ilm_policy: ILM policy name (default: wafer-monitor-policy)
+        - warm_after: Age at which indices move to the warm tier (default: 7d)
+    
+    Documents are routed by site_id so each site's events land on a single
+    shard and site-scoped searches only touch that shard.
     """
     
     def __init__(self, config: IntegrationConfig):
@@ -35,7 +45,14 @@ class ELKIntegration(BaseIntegration):
         self.username = self.get_config('username')
         self.password = self.get_config('password')
         self.api_key = self.get_config('api_key')
+        self.number_of_shards = int(self.get_config('number_of_shards', 1))
+        self.ilm_policy = self.get_config('ilm_policy', 'wafer-monitor-policy')
+        self.warm_after = self.get_config('warm_after', '7d')
         self.client: httpx.AsyncClient = None
+        
+        # Serialized bulk action lines for the current index, keyed by site_id
+        self._action_index: str = None
+        self._action_lines: Dict[str, str] = {}
     
     async def initialize(self) -> None:
         """Initialize Elasticsearch client."""
@@ -53,7 +70,9 @@ class ELKIntegration(BaseIntegration):
             auth=auth
         )
         
-        # Create index template if it doesn't exist
+        # Create the lifecycle policy if it doesn't exist (operator-tuned
+        # policies are left alone), then apply the index template
+        await self._create_ilm_policy()
         await self._create_index_template()
         
         self._initialized = True
@@ -64,6 +83,63 @@ class ELKIntegration(BaseIntegration):
             index_prefix=self.index_prefix
         )
     
+    async def _create_ilm_policy(self) -> None:
+        """
+        Create the hot/warm ILM policy referenced by the index template.
+        
+        An existing policy of the same name is kept as is, so changes made
+        to it in Elasticsearch survive restarts.
+        """
+        try:
+            r = await self.client.get(f'{self.es_url}/_ilm/policy/{self.ilm_policy}')
+            if r.status_code != 404:
+                if r.status_code in ES_OK_STATUSES:
+                    logger.info("elasticsearch_ilm_policy_exists", policy=self.ilm_policy)
+                else:
+                    logger.warning(
+                        "elasticsearch_ilm_policy_check_failed",
+                        policy=self.ilm_policy,
+                        status=r.status_code
+                    )
+                return
+        except Exception as e:
+            logger.warning("elasticsearch_ilm_policy_creation_failed", error=str(e))
+            return
+        
+        policy = {
+            'policy': {
+                'phases': {
+                    'hot': {
+                        'min_age': '0ms',
+                        'actions': {'set_priority': {'priority': 100}}
+                    },
+                    'warm': {
+                        'min_age': self.warm_after,
+                        'actions': {
+                            'set_priority': {'priority': 50},
+                            'forcemerge': {'max_num_segments': 1}
+                        }
+                    }
+                }
+            }
+        }
+        
+        try:
+            r = await self.client.put(
+                f'{self.es_url}/_ilm/policy/{self.ilm_policy}',
+                json=policy
+            )
+            if r.status_code in ES_OK_STATUSES:
+                logger.info("elasticsearch_ilm_policy_created", policy=self.ilm_policy)
+            else:
+                logger.warning(
+                    "elasticsearch_ilm_policy_creation_failed",
+                    policy=self.ilm_policy,
+                    status=r.status_code
+                )
+        except Exception as e:
+            logger.warning("elasticsearch_ilm_policy_creation_failed", error=str(e))
+    
     async def _create_index_template(self) -> None:
         """Create Elasticsearch index template for wafer monitoring data."""
         template = {
@@ -87,9 +163,9 @@ class ELKIntegration(BaseIntegration):
                 }
             },
             'settings': {
-                'number_of_shards': 1,
+                'number_of_shards': self.number_of_shards,
                 'number_of_replicas': 1,
-                'index.lifecycle.name': 'wafer-monitor-policy',
+                'index.lifecycle.name': self.ilm_policy,
                 'index.lifecycle.rollover_alias': f'{self.index_prefix}-alias'
             }
         }
@@ -99,7 +175,7 @@ class ELKIntegration(BaseIntegration):
                 f'{self.es_url}/_index_template/{self.index_prefix}-template',
                 json=template
             )
-            if r.status_code in (200, 201):
+            if r.status_code in ES_OK_STATUSES:
                 logger.info("elasticsearch_template_created")
         except Exception as e:
             logger.warning("elasticsearch_template_creation_failed", error=str(e))
@@ -114,10 +190,10 @@ class ELKIntegration(BaseIntegration):
         Returns:
             Elasticsearch document
         """
-        entity = event.get('entity', {})
-        event_data = event.get('event', {})
-        metrics = event_data.get('metrics', {})
-        app = event.get('app', {})
+        entity = event.get('entity', EMPTY_MAPPING)
+        event_data = event.get('event', EMPTY_MAPPING)
+        metrics = event_data.get('metrics', EMPTY_MAPPING)
+        app = event.get('app', EMPTY_MAPPING)
         
         return {
             'timestamp': event_data.get('at'),
@@ -140,6 +216,32 @@ class ELKIntegration(BaseIntegration):
             'metadata': event_data.get('metadata', {})
         }
     
+    def _bulk_action_line(self, index_name: str, site_id: str) -> str:
+        """
+        Get the serialized bulk action line for an index and site.
+        
+        Lines only depend on (index, site), so they are encoded once and
+        reused until the daily index rolls over.
+        
+        Args:
+            index_name: Target index
+            site_id: Site used as routing key
+            
+        Returns:
+            JSON-encoded bulk action line
+        """
+        if index_name != self._action_index:
+            self._action_index = index_name
+            self._action_lines = {}
+        
+        line = self._action_lines.get(site_id)
+        if line is None:
+            action = {'_index': index_name}
+            if site_id:
+                action['routing'] = site_id
+            line = self._action_lines[site_id] = json.dumps({'index': action})
+        return line
+    
     def _get_index_name(self) -> str:
         """Get current index name with date suffix."""
         today = datetime.utcnow().strftime('%Y.%m.%d')
@@ -150,13 +252,15 @@ class ELKIntegration(BaseIntegration):
         try:
             doc = self._event_to_es_document(event)
             index_name = self._get_index_name()
+            params = {'routing': doc['site_id']} if doc['site_id'] else None
             
             r = await self.client.post(
                 f'{self.es_url}/{index_name}/_doc',
-                json=doc
+                json=doc,
+                params=params
             )
             
-            if r.status_code in (200, 201):
+            if r.status_code in ES_OK_STATUSES:
                 logger.debug("event_sent_to_elasticsearch", index=index_name)
                 return True
             else:
@@ -174,10 +278,11 @@ class ELKIntegration(BaseIntegration):
             # Build bulk request
             bulk_data = []
             for event in events:
+                doc = self._event_to_es_document(event)
                 # Action line
-                bulk_data.append(json.dumps({'index': {'_index': index_name}}))
+                bulk_data.append(self._bulk_action_line(index_name, doc['site_id']))
                 # Document line
-                bulk_data.append(json.dumps(self._event_to_es_document(event)))
+                bulk_data.append(json.dumps(doc))
             
             bulk_body = '\n'.join(bulk_data) + '\n'
             
@@ -191,7 +296,15 @@ class ELKIntegration(BaseIntegration):
                 result = r.json()
                 items = result.get('items', [])
                 
-                success = sum(1 for item in items if item.get('index', {}).get('status') in (200, 201))
+                if result.get('errors') is False:
+                    # The bulk API sets `errors` if any item failed, so a clean
+                    # response needs no per-item scan
+                    success = len(items)
+                else:
+                    success = sum(
+                        1 for item in items
+                        if item.get('index', EMPTY_MAPPING).get('status') in ES_OK_STATUSES
+                    )
                 failed = len(items) - success
                 
                 logger.info(
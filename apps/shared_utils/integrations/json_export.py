@@ -1,10 +1,11 @@
 """JSON export integration for local file storage."""
-import json
 import asyncio
+import time
+import orjson
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
-from .base import BaseIntegration, IntegrationConfig
+from .base import BaseIntegration, IntegrationConfig, ROTATION_PERIODS_S, run_blocking_write
 
 try:
     import structlog
@@ -18,7 +19,8 @@ class JSONExportIntegration(BaseIntegration):
     """
     JSON export integration for local file storage.
     
-    Writes events to JSON files (one event per line - JSONL format).
+    Writes events to JSON files (one event per line - JSONL format),
+    encoded with orjson.
     
     Configuration:
         - output_dir: Directory for JSON files (default: /var/log/wafer-monitor)
@@ -27,6 +29,8 @@ class JSONExportIntegration(BaseIntegration):
         - compression: Enable gzip compression (default: False)
     """
     
+    cancel_on_timeout = False
+    
     def __init__(self, config: IntegrationConfig):
         """Initialize JSON export integration."""
         super().__init__(config)
@@ -34,7 +38,15 @@ class JSONExportIntegration(BaseIntegration):
         self.rotation = self.get_config('rotation', 'daily')
         self.pretty_print = self.get_config('pretty_print', False)
         self.compression = self.get_config('compression', False)
+        self._dumps_option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if self.pretty_print else 0)
         self._lock = asyncio.Lock()
+        # Current rotated filename and the rotation period it belongs to
+        self._filename: Optional[Path] = None
+        self._filename_key: Optional[int] = None
+        # Append handle kept open across writes; reopened when rotation
+        # changes the filename
+        self._file = None
+        self._file_path: Optional[Path] = None
     
     async def initialize(self) -> None:
         """Create output directory if it doesn't exist."""
@@ -48,9 +60,18 @@ class JSONExportIntegration(BaseIntegration):
         )
     
     def _get_json_filename(self) -> Path:
-        """Get current JSON filename based on rotation strategy."""
-        now = datetime.utcnow()
+        """
+        Get current JSON filename based on rotation strategy.
+        
+        The path is cached and only rebuilt when the rotation period rolls over.
+        """
+        now_s = time.time()
+        period = ROTATION_PERIODS_S.get(self.rotation)
+        key = int(now_s // period) if period else None
+        if self._filename is not None and key == self._filename_key:
+            return self._filename
         
+        now = datetime.utcfromtimestamp(now_s)
         if self.rotation == 'hourly':
             suffix = now.strftime('%Y%m%d_%H')
         elif self.rotation == 'daily':
@@ -59,7 +80,9 @@ class JSONExportIntegration(BaseIntegration):
             suffix = 'events'
         
         ext = '.jsonl.gz' if self.compression else '.jsonl'
-        return self.output_dir / f'wafer_events_{suffix}{ext}'
+        self._filename = self.output_dir / f'wafer_events_{suffix}{ext}'
+        self._filename_key = key
+        return self._filename
     
     async def send_event(self, event: Dict[str, Any]) -> bool:
         """Append event to JSON file."""
@@ -67,9 +90,9 @@ class JSONExportIntegration(BaseIntegration):
             async with self._lock:
                 filename = self._get_json_filename()
                 
-                # Use thread executor for file I/O
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
+                # Use thread executor for file I/O; the write runs to
+                # completion even if this call is cancelled
+                await run_blocking_write(
                     self._write_json_sync,
                     filename,
                     event
@@ -81,17 +104,47 @@ class JSONExportIntegration(BaseIntegration):
             logger.error("json_write_failed", error=str(e))
             return False
     
+    def _encode(self, event: Dict[str, Any]) -> bytes:
+        """Encode one event as a JSON line."""
+        return orjson.dumps(event, option=self._dumps_option) + b'\n'
+    
+    def _get_file(self, filename: Path):
+        """Return the open append handle for filename, reopening after rotation."""
+        if self._file_path != filename:
+            self._close_file()
+            self._file = open(filename, 'ab')
+            self._file_path = filename
+        return self._file
+    
+    def _close_file(self) -> None:
+        """Close the current append handle, if any."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._file_path = None
+    
     def _write_json_sync(self, filename: Path, event: Dict[str, Any]) -> None:
         """Synchronous JSON write."""
+        self._write_lines_sync(filename, [self._encode(event)])
+    
+    def _write_lines_sync(self, filename: Path, lines: List[bytes]) -> None:
+        """
+        Append encoded lines to filename.
+        
+        Plain files keep one handle open across writes. Gzip files are
+        opened per write so each write ends a complete gzip member and
+        the file stays readable while the exporter is running.
+        """
+        # One write per call instead of one per event
+        payload = b''.join(lines)
         if self.compression:
             import gzip
-            with gzip.open(filename, 'at', encoding='utf-8') as f:
-                json.dump(event, f, indent=2 if self.pretty_print else None)
-                f.write('\n')
+            with gzip.open(filename, 'ab') as f:
+                f.write(payload)
         else:
-            with open(filename, 'a', encoding='utf-8') as f:
-                json.dump(event, f, indent=2 if self.pretty_print else None)
-                f.write('\n')
+            f = self._get_file(filename)
+            f.write(payload)
+            f.flush()
     
     async def send_batch(self, events: List[Dict[str, Any]]) -> Dict[str, int]:
         """Append batch of events to JSON file."""
@@ -99,9 +152,9 @@ class JSONExportIntegration(BaseIntegration):
             async with self._lock:
                 filename = self._get_json_filename()
                 
-                # Use thread executor for file I/O
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
+                # Use thread executor for file I/O; the write runs to
+                # completion even if this call is cancelled
+                await run_blocking_write(
                     self._write_json_batch_sync,
                     filename,
                     events
@@ -119,17 +172,7 @@ class JSONExportIntegration(BaseIntegration):
     
     def _write_json_batch_sync(self, filename: Path, events: List[Dict[str, Any]]) -> None:
         """Synchronous JSON batch write."""
-        if self.compression:
-            import gzip
-            with gzip.open(filename, 'at', encoding='utf-8') as f:
-                for event in events:
-                    json.dump(event, f, indent=2 if self.pretty_print else None)
-                    f.write('\n')
-        else:
-            with open(filename, 'a', encoding='utf-8') as f:
-                for event in events:
-                    json.dump(event, f, indent=2 if self.pretty_print else None)
-                    f.write('\n')
+        self._write_lines_sync(filename, [self._encode(event) for event in events])
     
     async def health_check(self) -> Dict[str, Any]:
         """Check JSON export health."""
@@ -157,6 +200,8 @@ class JSONExportIntegration(BaseIntegration):
             }
     
     async def close(self) -> None:
-        """Cleanup (nothing to close for JSON)."""
+        """Close the open export file."""
+        async with self._lock:
+            self._close_file()
         logger.info("json_export_closed", name=self.name)
 
@@ -3,7 +3,7 @@ import httpx
 import json
 from typing import Dict, Any, List
 from datetime import datetime
-from .base import BaseIntegration, IntegrationConfig
+from .base import BaseIntegration, IntegrationConfig, EMPTY_MAPPING
 
 try:
     import structlog
@@ -57,9 +57,9 @@ class ZabbixIntegration(BaseIntegration):
         Returns:
             Zabbix trapper item format
         """
-        entity = event.get('entity', {})
-        event_data = event.get('event', {})
-        metrics = event_data.get('metrics', {})
+        entity = event.get('entity', EMPTY_MAPPING)
+        event_data = event.get('event', EMPTY_MAPPING)
+        metrics = event_data.get('metrics', EMPTY_MAPPING)
         
         # Create Zabbix item key
         entity_type = entity.get('type', 'unknown')
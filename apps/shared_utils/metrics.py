@@ -90,6 +90,14 @@ class MetricsCollector:
             registry=self.registry
         )
         
+        # Cache metrics
+        self.cache_requests_total = Counter(
+            'cache_requests_total',
+            'Response cache lookups',
+            ['cache', 'result'],
+            registry=self.registry
+        )
+        
         # System metrics
         self.system_cpu_usage = Gauge(
             'system_cpu_usage',
@@ -123,6 +131,10 @@ class MetricsCollector:
         if duration is not None:
             self.job_duration_seconds.labels(app_name=app_name).observe(duration)
     
+    def record_cache_lookup(self, cache: str, hit: bool) -> None:
+        """Record a cache hit or miss."""
+        self.cache_requests_total.labels(cache=cache, result='hit' if hit else 'miss').inc()
+    
     def update_pool_metrics(self, size: int, available: int) -> None:
         """Update database pool metrics."""
         self.db_pool_size.set(size)
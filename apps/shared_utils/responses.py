@@ -0,0 +1,33 @@
+"""Fast JSON responses backed by orjson."""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Serializes datetimes, UUIDs and numpy values natively, so query results
+    can be returned straight from database rows without a `jsonable_encoder`
+    pass. Anything orjson does not know falls back to `str`.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize content to JSON bytes.
+
+        Args:
+            content: Response payload
+
+        Returns:
+            Encoded JSON
+        """
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        )
@@ -0,0 +1,208 @@
+"""Spooling and request guards shared by the sidecar agent variants."""
+import os
+import time
+import asyncio
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from .config import SidecarAgentConfig
+from .logging import get_logger
+from .metrics import MetricsCollector
+
+logger = get_logger(__name__)
+
+
+def spool_order(p: Path) -> int:
+    """
+    Sort key that orders spool files by when they were written.
+
+    Args:
+        p: Spool file named `<idempotency_key>_<microseconds>.json`
+
+    Returns:
+        Spool time in microseconds, or 0 for an unrecognised name
+    """
+    try:
+        return int(p.stem.rpartition('_')[2])
+    except ValueError:
+        return 0
+
+
+class EventSpool:
+    """
+    Directory of events waiting for delivery, one JSON file per event.
+
+    `count` tracks the files on disk: seeded by `recount()` at startup,
+    bumped by `write()` and reset by every drain pass. `ready` is set
+    whenever the spool may hold files, so the drainer stays idle while it
+    is empty.
+
+    With `max_files` set, the `drop_newest` policy discards new events once
+    the spool is full and `drop_oldest` has each drain pass delete the
+    oldest excess files instead.
+    """
+
+    def __init__(self, config: SidecarAgentConfig, metrics: MetricsCollector):
+        """
+        Initialize the spool and create its directory.
+
+        Args:
+            config: Sidecar configuration (spool directory, size bound and policy)
+            metrics: Collector for spool counters and the spool size gauge
+        """
+        self.dir = Path(config.spool_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.max_files = config.spool_max_files
+        self.overflow = config.spool_overflow
+        self.metrics = metrics
+        self.count = 0
+        self.ready = asyncio.Event()
+
+    def recount(self) -> int:
+        """
+        Count the files on disk, e.g. those left by a previous run.
+
+        Returns:
+            Number of spooled events
+        """
+        self.count = sum(1 for _ in self.dir.glob('*.json'))
+        self.metrics.update_spool_count(self.count)
+        if self.count:
+            self.ready.set()
+        return self.count
+
+    def write(self, ev: dict) -> None:
+        """
+        Spool an event to disk for later retry.
+
+        Args:
+            ev: Event dict to spool
+        """
+        if (self.max_files and self.overflow == 'drop_newest'
+                and self.count >= self.max_files):
+            self.metrics.record_event_processed('spool', 'dropped')
+            logger.warning(
+                "spool_full_event_dropped",
+                idempotency_key=ev.get('idempotency_key'),
+                max_files=self.max_files
+            )
+            return
+        try:
+            idem_key = ev.get('idempotency_key', '') or os.urandom(16).hex()
+            timestamp = time.time_ns() // 1000
+            fname = self.dir / f"{idem_key}_{timestamp}.json"
+            fname.write_bytes(orjson.dumps(ev))
+            self.count += 1
+            self.ready.set()
+            self.metrics.record_event_processed('spool', 'success')
+            logger.info("event_spooled", filename=fname.name)
+        except Exception as e:
+            self.metrics.record_event_processed('spool', 'failed')
+            logger.error(
+                "spool_failed",
+                error=str(e),
+                error_type=type(e).__name__
+            )
+
+    def pending(self) -> List[Path]:
+        """
+        List the spooled files, oldest first, after enforcing `max_files`.
+
+        Oldest first, so an entity's updates are delivered in order.
+
+        Returns:
+            Files waiting for delivery
+        """
+        files = sorted(self.dir.glob('*.json'), key=spool_order)
+        excess = len(files) - self.max_files
+        if self.max_files and self.overflow == 'drop_oldest' and excess > 0:
+            for p in files[:excess]:
+                p.unlink(missing_ok=True)
+                self.metrics.record_event_processed('spool', 'dropped')
+            logger.warning("spool_full_oldest_dropped", count=excess, max_files=self.max_files)
+            files = files[excess:]
+        self.count = len(files)
+        self.metrics.update_spool_count(self.count)
+        return files
+
+    async def drain_forever(
+        self,
+        interval_s: float,
+        drain: Callable[[List[Path]], Awaitable[int]]
+    ) -> None:
+        """
+        Run drain passes for as long as the spool holds files.
+
+        A pass runs `interval_s` seconds after the first event lands in an
+        empty spool, then on that interval until the spool is empty again.
+        An empty spool is not polled.
+
+        Args:
+            interval_s: Delay before each pass
+            drain: Delivers the given files, removes the delivered ones and
+                returns how many it removed
+        """
+        logger.info("spool_drainer_started", interval_s=interval_s)
+        while True:
+            await self.ready.wait()
+            await asyncio.sleep(interval_s)
+            # Cleared before the scan, so events spooled during the pass
+            # schedule another one
+            self.ready.clear()
+            try:
+                files = self.pending()
+                if files:
+                    logger.debug("draining_spool", count=len(files))
+
+                delivered = await drain(files)
+
+                self.count -= delivered
+                self.metrics.update_spool_count(self.count)
+                if delivered < len(files):
+                    self.ready.set()
+
+            except Exception as e:
+                logger.error("spool_drain_error", error=str(e))
+                self.ready.set()
+
+
+def install_size_guard(app: FastAPI, config: SidecarAgentConfig, metrics: MetricsCollector) -> None:
+    """
+    Reject oversized ingest bodies from Content-Length before they are read or parsed.
+
+    Only the endpoints that accept events are checked; other routes take no
+    body and skip the check entirely.
+
+    Args:
+        app: Sidecar application
+        config: Sidecar configuration (per-event size and batch limits)
+        metrics: Collector for rejected requests
+    """
+    limits: Dict[str, int] = {
+        '/v1/ingest/events': config.max_event_size_bytes,
+        '/v1/ingest/events:batch': config.max_event_size_bytes * config.max_batch_size,
+    }
+
+    @app.middleware("http")
+    async def size_guard_middleware(request: Request, call_next):
+        """Reject an ingest request whose declared body exceeds its limit."""
+        limit = limits.get(request.url.path)
+        if limit is not None and request.method == 'POST':
+            length = request.headers.get('content-length', '')
+            if length.isdigit() and int(length) > limit:
+                metrics.record_event_processed('ingest', 'too_large')
+                logger.warning(
+                    "ingest_payload_too_large",
+                    endpoint=request.url.path,
+                    content_length=int(length),
+                    limit=limit
+                )
+                return JSONResponse(
+                    {'detail': f'payload exceeds {limit} bytes'},
+                    status_code=413
+                )
+        return await call_next(request)
@@ -4,24 +4,24 @@ Sidecar Agent - Event forwarding service with spooling support.
 Forwards monitoring events from business applications to the Local API.
 Provides resilience through local spooling when the Local API is unavailable.
 """
-import os
 import asyncio
-import json
+import orjson
 import httpx
-import uuid
 from pathlib import Path
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import List
+from typing import List, Tuple
 import time
 
 # Import shared utilities
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+APPS_DIR = str(Path(__file__).parent.parent)
+if APPS_DIR not in sys.path:
+    sys.path.insert(0, APPS_DIR)
 from shared_utils import setup_logging, get_logger, setup_tracing, instrument_fastapi
 from shared_utils import MetricsCollector, get_metrics_collector
-from shared_utils import SidecarAgentConfig
+from shared_utils import SidecarAgentConfig, EventSpool, install_size_guard
 
 # Configuration
 config = SidecarAgentConfig()
@@ -38,9 +38,19 @@ else:
 # Initialize metrics collector
 metrics = get_metrics_collector(config.service_name)
 
-# Setup directories
-SPOOL_DIR = Path(config.spool_dir)
-SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+# Events waiting for the Local API
+spool = EventSpool(config, metrics)
+
+# Events per drain request: halved when a batch times out, grown back
+# step by step after each delivered batch, capped at max_batch_size
+drain_batch_size = config.max_batch_size
+
+# Monotonic deadline before which ingest skips forwarding and spools
+# directly, set when the Local API cannot be reached
+forward_paused_until = 0.0
+
+# orjson emits compact UTF-8 bytes, so bodies are posted pre-encoded
+JSON_HEADERS = {'Content-Type': 'application/json'}
 
 # FastAPI app
 app = FastAPI(
@@ -63,12 +73,15 @@ class IngestEvent(BaseModel):
     event: dict
 
 
+install_size_guard(app, config, metrics)
+
+
 @app.middleware("http")
 async def metrics_middleware(request: Request, call_next):
     """Middleware to collect HTTP metrics."""
-    start_time = time.time()
+    start_time = time.monotonic()
     response = await call_next(request)
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     
     metrics.record_http_request(
         method=request.method,
@@ -80,6 +93,21 @@ async def metrics_middleware(request: Request, call_next):
     return response
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared HTTP client used to reach the Local API.
+    
+    Returns:
+        Shared async HTTP client with keep-alive connections
+    """
+    if not hasattr(app.state, 'http_client'):
+        app.state.http_client = httpx.AsyncClient(
+            base_url=config.local_api_base,
+            timeout=config.request_timeout_s
+        )
+    return app.state.http_client
+
+
 async def forward(ev: dict) -> None:
     """
     Forward an event to the Local API.
@@ -90,87 +118,204 @@ async def forward(ev: dict) -> None:
     Raises:
         httpx.HTTPError: If the request fails
     """
-    async with httpx.AsyncClient(timeout=config.request_timeout_s) as client:
-        try:
-            logger.debug("forwarding_event", event_kind=ev.get('event', {}).get('kind'))
-            r = await client.post(f'{config.local_api_base}/v1/ingest/events', json=ev)
-            r.raise_for_status()
-            metrics.record_event_processed('forward', 'success')
-            logger.info(
-                "event_forwarded",
-                event_kind=ev.get('event', {}).get('kind'),
-                status_code=r.status_code
-            )
-        except Exception as e:
-            metrics.record_event_processed('forward', 'failed')
-            logger.error(
-                "forward_failed",
-                event_kind=ev.get('event', {}).get('kind'),
-                error=str(e),
-                error_type=type(e).__name__
-            )
-            raise
+    try:
+        logger.debug("forwarding_event", event_kind=ev.get('event', {}).get('kind'))
+        r = await get_http_client().post(
+            '/v1/ingest/events', content=orjson.dumps(ev), headers=JSON_HEADERS
+        )
+        r.raise_for_status()
+        resume_forwarding()
+        metrics.record_event_processed('forward', 'success')
+        logger.info(
+            "event_forwarded",
+            event_kind=ev.get('event', {}).get('kind'),
+            status_code=r.status_code
+        )
+    except Exception as e:
+        if isinstance(e, httpx.TransportError):
+            pause_forwarding()
+        metrics.record_event_processed('forward', 'failed')
+        logger.error(
+            "forward_failed",
+            event_kind=ev.get('event', {}).get('kind'),
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        raise
+
+
+def pause_forwarding() -> None:
+    """Spool new events directly for `config.forward_pause_s` seconds."""
+    global forward_paused_until
+    if config.forward_pause_s and not forwarding_paused():
+        forward_paused_until = time.monotonic() + config.forward_pause_s
+        logger.warning("forwarding_paused", pause_s=config.forward_pause_s)
+
+
+def resume_forwarding() -> None:
+    """Forward new events again after the Local API has accepted a request."""
+    global forward_paused_until
+    if forward_paused_until:
+        forward_paused_until = 0.0
+        logger.info("forwarding_resumed")
 
 
-def spool(ev: dict) -> None:
+def forwarding_paused() -> bool:
     """
-    Spool an event to disk for later retry.
+    Whether ingest should skip forwarding.
+    
+    Returns:
+        True while a recent connection failure pauses forwarding
+    """
+    return time.monotonic() < forward_paused_until
+
+
+async def forward_batch(frames: List[bytes]) -> List[str]:
+    """
+    Forward several already-encoded events to the Local API in one request.
     
     Args:
-        ev: Event dict to spool
+        frames: JSON-encoded event objects, e.g. spool file contents
+        
+    Returns:
+        Idempotency keys of the events the Local API did not store
+        
+    Raises:
+        httpx.HTTPError: If the request fails
+    """
+    r = await get_http_client().post(
+        '/v1/ingest/events:batch', content=b'[' + b','.join(frames) + b']', headers=JSON_HEADERS
+    )
+    r.raise_for_status()
+    return r.json().get('failed_keys', [])
+
+
+async def drain_files(files: List[Path]) -> int:
+    """
+    Forward one chunk of spool files and remove the ones delivered.
+    
+    Spool files already hold encoded JSON, so the chunk is sent as a single
+    batch request without decoding it. Events the Local API reports as not
+    stored keep their files for the next pass; the rest are removed, so
+    stored events are never sent twice. If the Local API rejects the request
+    as a whole, each file is sent on its own so a single bad event does not
+    hold back the rest, stopping at the first connection error.
+    
+    A timed-out batch halves `drain_batch_size` for later chunks; each
+    delivered batch grows it back towards `config.max_batch_size`.
+    
+    Args:
+        files: Spool files to drain, oldest first
+        
+    Returns:
+        Number of files delivered and removed
     """
+    global drain_batch_size
+    loaded = []
+    for p in files:
+        try:
+            loaded.append((p, p.read_bytes()))
+        except Exception as e:
+            logger.warning("spool_drain_item_failed", filename=p.name, error=str(e))
+    if not loaded:
+        return 0
+    
     try:
-        idem_key = ev.get('idempotency_key', '') or str(uuid.uuid4())
-        timestamp = int(time.time() * 1e6)
-        fname = SPOOL_DIR / f"{idem_key}_{timestamp}.json"
-        fname.write_text(json.dumps(ev), encoding='utf-8')
-        metrics.record_event_processed('spool', 'success')
-        logger.info("event_spooled", filename=fname.name)
+        failed_keys = await forward_batch([raw for _, raw in loaded])
+    except httpx.TransportError as e:
+        # The Local API may have stored the batch before the connection
+        # dropped, so nothing is resent until the next pass
+        if isinstance(e, httpx.TimeoutException):
+            drain_batch_size = max(1, drain_batch_size // 2)
+            logger.warning("drain_batch_size_reduced", batch_size=drain_batch_size)
+        else:
+            pause_forwarding()
+        metrics.record_event_processed('forward_batch', 'failed')
+        logger.warning("spool_batch_failed", count=len(loaded), error=str(e))
+        return 0
     except Exception as e:
-        metrics.record_event_processed('spool', 'failed')
-        logger.error(
-            "spool_failed",
-            error=str(e),
-            error_type=type(e).__name__
+        metrics.record_event_processed('forward_batch', 'failed')
+        logger.warning("spool_batch_failed", count=len(loaded), error=str(e))
+        return await drain_files_singly(loaded)
+    
+    resume_forwarding()
+    drain_batch_size = min(
+        config.max_batch_size, drain_batch_size + max(1, config.max_batch_size // 10)
+    )
+    if failed_keys:
+        failed = set(failed_keys)
+        # Only partial batches pay for decoding, to map files to their keys
+        kept = [
+            (p, raw) for p, raw in loaded
+            if orjson.loads(raw).get('idempotency_key') in failed
+        ]
+        metrics.record_event_processed('forward_batch', 'partial')
+        logger.warning(
+            "spool_batch_partially_stored",
+            count=len(loaded),
+            failed=len(kept)
         )
+    else:
+        kept = []
+        metrics.record_event_processed('forward_batch', 'success')
+    
+    kept_paths = {p for p, _ in kept}
+    for p, _ in loaded:
+        if p not in kept_paths:
+            p.unlink(missing_ok=True)
+    logger.debug("spool_batch_processed", count=len(loaded) - len(kept))
+    return len(loaded) - len(kept)
 
 
-async def drain_spool() -> None:
+async def drain_files_singly(loaded: List[Tuple[Path, bytes]]) -> int:
     """
-    Background task to drain the spool directory.
+    Forward spool files one request each, after a rejected batch request.
     
-    Continuously attempts to forward spooled events to the Local API.
-    Runs every `config.drain_interval_s` seconds.
+    Args:
+        loaded: (spool file, file contents) pairs, oldest first
+        
+    Returns:
+        Number of files delivered and removed
     """
-    logger.info("spool_drainer_started", interval_s=config.drain_interval_s)
-    
-    while True:
+    delivered = 0
+    for p, raw in loaded:
         try:
-            files = sorted(SPOOL_DIR.glob('*.json'))
-            spool_count = len(files)
-            metrics.update_spool_count(spool_count)
-            
-            if spool_count > 0:
-                logger.debug("draining_spool", count=spool_count)
-            
-            for p in files:
-                try:
-                    data = json.loads(p.read_text(encoding='utf-8'))
-                    await forward(data)
-                    p.unlink(missing_ok=True)
-                    logger.debug("spool_file_processed", filename=p.name)
-                except Exception as e:
-                    logger.warning(
-                        "spool_drain_item_failed",
-                        filename=p.name,
-                        error=str(e)
-                    )
-                    # Keep file for next attempt
-            
+            await forward(orjson.loads(raw))
+            p.unlink(missing_ok=True)
+            delivered += 1
+            logger.debug("spool_file_processed", filename=p.name)
+        except httpx.TransportError:
+            # Local API unreachable: leave the rest for the next pass
+            break
         except Exception as e:
-            logger.error("spool_drain_error", error=str(e))
+            logger.warning(
+                "spool_drain_item_failed",
+                filename=p.name,
+                error=str(e)
+            )
+            # Keep file for next attempt
+    return delivered
+
+
+async def drain_chunks(files: List[Path]) -> int:
+    """
+    Drain spool files in chunks of up to `drain_batch_size`.
+    
+    Stops early once a connection failure pauses forwarding.
+    
+    Args:
+        files: Spool files to drain, oldest first
         
-        await asyncio.sleep(config.drain_interval_s)
+    Returns:
+        Number of files delivered and removed
+    """
+    delivered = 0
+    i = 0
+    while i < len(files) and not forwarding_paused():
+        chunk = files[i:i + drain_batch_size]
+        i += len(chunk)
+        delivered += await drain_files(chunk)
+    return delivered
 
 
 @app.on_event('startup')
@@ -179,17 +324,22 @@ async def start() -> None:
     logger.info(
         "service_starting",
         local_api_base=config.local_api_base,
-        spool_dir=str(SPOOL_DIR),
+        spool_dir=str(spool.dir),
         drain_interval_s=config.drain_interval_s
     )
-    asyncio.create_task(drain_spool())
+    # Count files left by a previous run, so the spool bound applies to them
+    spool.recount()
+    asyncio.create_task(spool.drain_forever(config.drain_interval_s, drain_chunks))
     logger.info("service_started")
 
 
 @app.on_event('shutdown')
 async def shutdown() -> None:
-    """Shutdown handler."""
+    """Shutdown handler - close the shared HTTP client."""
     logger.info("service_shutting_down")
+    if hasattr(app.state, 'http_client'):
+        await app.state.http_client.aclose()
+        logger.info("http_client_closed")
 
 
 @app.post('/v1/ingest/events')
@@ -197,8 +347,9 @@ async def ingest(ev: IngestEvent) -> JSONResponse:
     """
     Ingest a single event.
     
-    Attempts to forward immediately. If forwarding fails, spools the event
-    for later retry by the background drainer.
+    Attempts to forward immediately. If forwarding fails, or is paused
+    after a recent connection failure, spools the event for later retry by
+    the background drainer.
     
     Args:
         ev: Event to ingest
@@ -206,15 +357,19 @@ async def ingest(ev: IngestEvent) -> JSONResponse:
     Returns:
         Success response
     """
+    data = ev.model_dump()
+    if forwarding_paused():
+        spool.write(data)
+        return JSONResponse({'ok': True})
     try:
-        await forward(ev.model_dump())
+        await forward(data)
     except Exception as e:
         logger.warning(
             "forward_failed_spooling",
             idempotency_key=ev.idempotency_key,
             error=str(e)
         )
-        spool(ev.model_dump())
+        spool.write(data)
     
     return JSONResponse({'ok': True})
 
@@ -224,7 +379,8 @@ async def ingest_batch(events: List[IngestEvent]) -> JSONResponse:
     """
     Ingest a batch of events.
     
-    Attempts to forward each event. Failed events are spooled.
+    Attempts to forward each event. Failed events are spooled, as is every
+    event seen while forwarding is paused.
     
     Args:
         events: List of events to ingest
@@ -234,11 +390,15 @@ async def ingest_batch(events: List[IngestEvent]) -> JSONResponse:
     """
     ok = 0
     for ev in events:
+        data = ev.model_dump()
+        if forwarding_paused():
+            spool.write(data)
+            continue
         try:
-            await forward(ev.model_dump())
+            await forward(data)
             ok += 1
         except Exception:
-            spool(ev.model_dump())
+            spool.write(data)
     
     logger.info(
         "batch_processed",
@@ -257,13 +417,13 @@ async def ingest_batch(events: List[IngestEvent]) -> JSONResponse:
 @app.get('/v1/healthz')
 async def healthz() -> JSONResponse:
     """Health check endpoint."""
-    spool_count = len(list(SPOOL_DIR.glob('*.json')))
+    spool_count = len(list(spool.dir.glob('*.json')))
     return JSONResponse({
         'status': 'ok',
         'service': config.service_name,
         'version': '2.0.0',
         'spool_count': spool_count,
-        'spool_dir': str(SPOOL_DIR)
+        'spool_dir': str(spool.dir)
     })
 
 
@@ -278,4 +438,4 @@ async def metrics_endpoint() -> Response:
 
 if __name__ == '__main__':
     import uvicorn
-    uvicorn.run(app, host='0.0.0.0', port=8000, log_config=None)
+    uvicorn.run(app, host='0.0.0.0', port=8000, log_config=None, loop='uvloop', http='httptools')
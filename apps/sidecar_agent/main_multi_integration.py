@@ -9,10 +9,8 @@ Enhanced version that supports multiple backends simultaneously:
 - JSON export  
 - Custom webhooks
 """
-import os
 import asyncio
-import json
-import uuid
+import orjson
 from pathlib import Path
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
@@ -22,10 +20,12 @@ import time
 
 # Import shared utilities
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+APPS_DIR = str(Path(__file__).parent.parent)
+if APPS_DIR not in sys.path:
+    sys.path.insert(0, APPS_DIR)
 from shared_utils import setup_logging, get_logger
 from shared_utils import MetricsCollector, get_metrics_collector
-from shared_utils import SidecarAgentConfig
+from shared_utils import SidecarAgentConfig, EventSpool, install_size_guard
 from shared_utils.integrations import IntegrationContainer, get_container, IntegrationConfig, IntegrationType
 
 # Configuration
@@ -38,9 +38,8 @@ logger = get_logger(__name__)
 # Initialize metrics collector
 metrics = get_metrics_collector(config.service_name)
 
-# Setup directories
-SPOOL_DIR = Path(config.spool_dir)
-SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+# Events no integration accepted
+spool = EventSpool(config, metrics)
 
 # FastAPI app
 app = FastAPI(
@@ -62,12 +61,15 @@ class IngestEvent(BaseModel):
     event: dict
 
 
+install_size_guard(app, config, metrics)
+
+
 @app.middleware("http")
 async def metrics_middleware(request: Request, call_next):
     """Middleware to collect HTTP metrics."""
-    start_time = time.time()
+    start_time = time.monotonic()
     response = await call_next(request)
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     
     metrics.record_http_request(
         method=request.method,
@@ -119,71 +121,41 @@ async def forward(ev: dict) -> Dict[str, bool]:
     return results
 
 
-def spool(ev: dict) -> None:
+async def drain_files(files: List[Path]) -> int:
     """
-    Spool an event to disk for later retry.
+    Forward spool files to all integrations, one event at a time.
     
-    Args:
-        ev: Event dict to spool
-    """
-    try:
-        idem_key = ev.get('idempotency_key', '') or str(uuid.uuid4())
-        timestamp = int(time.time() * 1e6)
-        fname = SPOOL_DIR / f"{idem_key}_{timestamp}.json"
-        fname.write_text(json.dumps(ev), encoding='utf-8')
-        metrics.record_event_processed('spool', 'success')
-        logger.info("event_spooled", filename=fname.name)
-    except Exception as e:
-        metrics.record_event_processed('spool', 'failed')
-        logger.error(
-            "spool_failed",
-            error=str(e),
-            error_type=type(e).__name__
-        )
-
-
-async def drain_spool() -> None:
-    """
-    Background task to drain the spool directory.
+    A file is removed once at least one integration accepts its event.
     
-    Continuously attempts to forward spooled events to all integrations.
+    Args:
+        files: Spool files to drain, oldest first
+        
+    Returns:
+        Number of files delivered and removed
     """
-    logger.info("spool_drainer_started", interval_s=config.drain_interval_s)
-    
-    while True:
+    delivered = 0
+    for p in files:
         try:
-            files = sorted(SPOOL_DIR.glob('*.json'))
-            spool_count = len(files)
-            metrics.update_spool_count(spool_count)
-            
-            if spool_count > 0:
-                logger.debug("draining_spool", count=spool_count)
-            
-            for p in files:
-                try:
-                    data = json.loads(p.read_text(encoding='utf-8'))
-                    results = await forward(data)
-                    
-                    # Only remove file if at least one integration succeeded
-                    if any(results.values()):
-                        p.unlink(missing_ok=True)
-                        logger.debug("spool_file_processed", filename=p.name)
-                    else:
-                        logger.warning(
-                            "spool_file_forward_all_failed",
-                            filename=p.name
-                        )
-                except Exception as e:
-                    logger.warning(
-                        "spool_drain_item_failed",
-                        filename=p.name,
-                        error=str(e)
-                    )
+            data = orjson.loads(p.read_bytes())
+            results = await forward(data)
             
+            # Only remove file if at least one integration succeeded
+            if any(results.values()):
+                p.unlink(missing_ok=True)
+                delivered += 1
+                logger.debug("spool_file_processed", filename=p.name)
+            else:
+                logger.warning(
+                    "spool_file_forward_all_failed",
+                    filename=p.name
+                )
         except Exception as e:
-            logger.error("spool_drain_error", error=str(e))
-        
-        await asyncio.sleep(config.drain_interval_s)
+            logger.warning(
+                "spool_drain_item_failed",
+                filename=p.name,
+                error=str(e)
+            )
+    return delivered
 
 
 @app.on_event('startup')
@@ -191,7 +163,7 @@ async def start() -> None:
     """Startup handler - initialize integrations and start background tasks."""
     logger.info(
         "service_starting",
-        spool_dir=str(SPOOL_DIR),
+        spool_dir=str(spool.dir),
         drain_interval_s=config.drain_interval_s
     )
     
@@ -209,8 +181,10 @@ async def start() -> None:
         integrations=enabled
     )
     
-    # Start spool drainer
-    asyncio.create_task(drain_spool())
+    # Count files left by a previous run, so the spool bound applies to
+    # them, then start the spool drainer
+    spool.recount()
+    asyncio.create_task(spool.drain_forever(config.drain_interval_s, drain_files))
     
     logger.info("service_started")
 
@@ -237,7 +211,8 @@ async def ingest(ev: IngestEvent) -> JSONResponse:
     Returns:
         Success response with forwarding details
     """
-    results = await forward(ev.model_dump())
+    data = ev.model_dump()
+    results = await forward(data)
     
     # If all integrations failed, spool the event
     if not any(results.values()):
@@ -245,7 +220,7 @@ async def ingest(ev: IngestEvent) -> JSONResponse:
             "all_integrations_failed_spooling",
             idempotency_key=ev.idempotency_key
         )
-        spool(ev.model_dump())
+        spool.write(data)
     
     return JSONResponse({
         'ok': True,
@@ -269,14 +244,15 @@ async def ingest_batch(events: List[IngestEvent]) -> JSONResponse:
     event_dicts = [ev.model_dump() for ev in events]
     results = await container.send_batch(event_dicts)
     
-    # Spool events that failed on all integrations
-    for i, ev in enumerate(events):
-        all_failed = all(
-            result.get('failed', 0) > 0 
-            for result in results.values()
-        )
-        if all_failed:
-            spool(ev.model_dump())
+    # Integrations report per-batch counts, so the whole batch is spooled
+    # when every integration reported failures
+    all_failed = all(
+        result.get('failed', 0) > 0 
+        for result in results.values()
+    )
+    if all_failed:
+        for data in event_dicts:
+            spool.write(data)
     
     logger.info(
         "batch_processed",
@@ -294,7 +270,7 @@ async def ingest_batch(events: List[IngestEvent]) -> JSONResponse:
 @app.get('/v1/healthz')
 async def healthz() -> JSONResponse:
     """Health check endpoint with integration status."""
-    spool_count = len(list(SPOOL_DIR.glob('*.json')))
+    spool_count = len(list(spool.dir.glob('*.json')))
     
     # Check health of all integrations
     integration_health = await container.health_check_all()
@@ -310,7 +286,7 @@ async def healthz() -> JSONResponse:
         'service': config.service_name,
         'version': '3.0.0',
         'spool_count': spool_count,
-        'spool_dir': str(SPOOL_DIR),
+        'spool_dir': str(spool.dir),
         'integrations': integration_health
     })
 
@@ -340,5 +316,5 @@ async def metrics_endpoint() -> Response:
 
 if __name__ == '__main__':
     import uvicorn
-    uvicorn.run(app, host='0.0.0.0', port=8000, log_config=None)
+    uvicorn.run(app, host='0.0.0.0', port=8000, log_config=None, loop='uvloop', http='httptools')
 
@@ -12,7 +12,7 @@ SPOOLDIR="${REPO_ROOT}/deploy/podman/business/spool"
 mkdir -p "$SPOOLDIR"
 
 if ! podman container exists wm-sidecar; then
-  podman run -d --name wm-sidecar --pod "$POD"     -v "$REPO_ROOT":/workspace:Z -w /app     -e LOCAL_API_BASE=http://host.containers.internal:18000     -e SPOOL_DIR=/tmp/sidecar-spool     -v "$SPOOLDIR":/tmp/sidecar-spool:Z     docker.io/library/python:3.11-slim bash -lc "pip install -e /workspace && python -m uvicorn apps.sidecar_agent.main:app --host 0.0.0.0 --port 8000"
+  podman run -d --name wm-sidecar --pod "$POD"     -v "$REPO_ROOT":/workspace:Z -w /app     -e LOCAL_API_BASE=http://host.containers.internal:18000     -e SPOOL_DIR=/tmp/sidecar-spool     -v "$SPOOLDIR":/tmp/sidecar-spool:Z     docker.io/library/python:3.11-slim bash -lc "pip install -e /workspace && python -m uvicorn apps.sidecar_agent.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools"
 fi
 
 podman pod ps
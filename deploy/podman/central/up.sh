@@ -9,7 +9,7 @@ if ! podman pod exists "$POD"; then
 fi
 
 if ! podman container exists wm-central-api; then
-  podman run -d --name wm-central-api --pod "$POD"     -v "$REPO_ROOT":/workspace:Z -w /app     -e SITES=fab1=http://host.containers.internal:18000     docker.io/library/python:3.11-slim bash -lc "pip install -e /workspace && python -m uvicorn apps.central_api.main:app --host 0.0.0.0 --port 19000"
+  podman run -d --name wm-central-api --pod "$POD"     -v "$REPO_ROOT":/workspace:Z -w /app     -e SITES=fab1=http://host.containers.internal:18000     docker.io/library/python:3.11-slim bash -lc "pip install -e /workspace && python -m uvicorn apps.central_api.main:app --host 0.0.0.0 --port 19000 --loop uvloop --http httptools"
 fi
 
 if ! podman container exists wm-web-central; then
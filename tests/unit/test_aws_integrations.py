@@ -119,6 +119,14 @@ class TestAWSCloudWatchIntegration:
         assert mem_metric['Unit'] == 'Megabytes'
         assert mem_metric['Value'] == 512
     
+    def test_event_without_datapoints_needs_no_timestamp(self, cloudwatch_config, sample_event):
+        """Test an event that yields no datapoints is not required to carry 'at'."""
+        integration = AWSCloudWatchIntegration(cloudwatch_config)
+        sample_event['event'].update(kind='progress', metrics={})
+        del sample_event['event']['at']
+        
+        assert integration._event_to_cloudwatch_metrics(sample_event) == []
+    
     def test_event_to_log_message(self, cloudwatch_config, sample_event):
         """Test event to CloudWatch log message conversion."""
         integration = AWSCloudWatchIntegration(cloudwatch_config)
@@ -293,6 +301,21 @@ class TestAWSXRayIntegration:
         assert segment['annotations']['status'] == 'succeeded'
         assert 'test-job-123' not in integration.pending_segments
     
+    def test_pending_segments_bounded(self, xray_config):
+        """Test unfinished segments are evicted oldest first."""
+        xray_config.config['max_pending_segments'] = 2
+        integration = AWSXRayIntegration(xray_config)
+        
+        for job_id in ('job-1', 'job-2', 'job-3'):
+            integration._event_to_xray_segment({
+                'site_id': 'site1',
+                'app': {'name': 'test-app', 'version': '1.0.0'},
+                'entity': {'type': 'job', 'id': job_id},
+                'event': {'kind': 'started', 'at': '2024-01-15T10:30:00Z'}
+            })
+        
+        assert list(integration.pending_segments) == ['job-2', 'job-3']
+    
     @pytest.mark.asyncio
     async def test_send_event(self, xray_config):
         """Test sending event to X-Ray."""
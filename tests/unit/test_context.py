@@ -152,4 +152,43 @@ class TestMonitored:
         start_event = emitter.sent[0]
         assert start_event.event.metadata['batch_id'] == '12345'
         assert start_event.event.metadata['priority'] == 'high'
-
+    
+    def test_monitored_background_sampler(self):
+        """Test that the background sampler tracks memory and stops on exit."""
+        app = AppRef(app_id=uuid4(), name='test-app', version='1.0')
+        emitter = DummyEmitter()
+        
+        with Monitored(
+            site_id='fab1',
+            app=app,
+            entity_type='job',
+            emitter=emitter,
+            enable_logging=False,
+            sample_interval_s=0.01
+        ) as ctx:
+            sampler = ctx._sampler
+            assert sampler.is_alive()
+            time.sleep(0.05)
+            ctx.tick()
+        
+        assert not sampler.is_alive()
+        assert emitter.sent[1].event.metrics['mem_max_mb'] > 0
+        assert emitter.sent[-1].event.status == 'succeeded'
+    
+    @pytest.mark.parametrize('interval', [0, -1.0, float('nan')])
+    def test_monitored_rejects_non_positive_sample_interval(self, interval):
+        """Test that a sample interval that is not positive is rejected up front."""
+        app = AppRef(app_id=uuid4(), name='test-app', version='1.0')
+        emitter = DummyEmitter()
+        
+        with pytest.raises(ValueError):
+            Monitored(
+                site_id='fab1',
+                app=app,
+                entity_type='job',
+                emitter=emitter,
+                enable_logging=False,
+                sample_interval_s=interval
+            )
+        
+        assert emitter.sent == []
@@ -1,4 +1,6 @@
 """Unit tests for SidecarEmitter."""
+import json
+import threading
 import pytest
 from uuid import uuid4
 from unittest.mock import Mock, patch
@@ -8,7 +10,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'apps' / 'monitoring_sdk'))
 
-from monitoring_sdk.emitter import SidecarEmitter
+from monitoring_sdk.emitter import SidecarEmitter, BackgroundEmitter
 from monitoring_sdk.models import AppRef, EntityRef, JobEvent
 
 
@@ -81,7 +83,7 @@ class TestSidecarEmitter:
         
         assert mock_post.called
         call_args = mock_post.call_args
-        assert len(call_args[1]['json']) == 5
+        assert len(json.loads(call_args[1]['content'])) == 5
     
     def test_context_manager(self):
         """Test emitter as context manager."""
@@ -91,3 +93,40 @@ class TestSidecarEmitter:
         # Should close cleanly
         assert True
 
+
+class TestBackgroundEmitter:
+    """Test suite for BackgroundEmitter."""
+    
+    def test_events_sent_on_close(self):
+        """Test queued events are all delivered before close returns."""
+        inner = Mock()
+        app = AppRef(app_id=uuid4(), name='test-app', version='1.0')
+        entity = EntityRef(type='job', id=uuid4(), parent_id=None, business_key='test', sub_key=None)
+        events = [JobEvent.now('progress', 'fab1', app, entity, status='running') for _ in range(5)]
+        
+        with BackgroundEmitter(emitter=inner) as emitter:
+            for ev in events:
+                emitter.send(ev)
+        
+        sent = [c.args[0] for c in inner.send.call_args_list]
+        for c in inner.send_batch.call_args_list:
+            sent.extend(c.args[0])
+        assert sent == events
+        assert emitter.dropped == 0
+        inner.close.assert_called_once()
+
+    
+    def test_close_leaves_busy_emitter_open(self):
+        """Test close does not close the emitter under a send still in progress."""
+        release = threading.Event()
+        inner = Mock()
+        inner.send.side_effect = lambda ev: release.wait()
+        app = AppRef(app_id=uuid4(), name='test-app', version='1.0')
+        entity = EntityRef(type='job', id=uuid4(), parent_id=None, business_key='test', sub_key=None)
+        
+        emitter = BackgroundEmitter(emitter=inner)
+        emitter.send(JobEvent.now('progress', 'fab1', app, entity, status='running'))
+        emitter.close(timeout=0.1)
+        
+        inner.close.assert_not_called()
+        release.set()
@@ -2,6 +2,9 @@
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 import asyncio
+import json
+import time
+import httpx
 
 import sys
 from pathlib import Path
@@ -13,7 +16,8 @@ from shared_utils.integrations import (
     IntegrationType,
     LocalAPIIntegration,
     CSVExportIntegration,
-    JSONExportIntegration
+    JSONExportIntegration,
+    ELKIntegration
 )
 
 
@@ -112,7 +116,76 @@ class TestIntegrationContainer:
         
         assert results == {'mock': {'success': 5, 'failed': 0}}
         mock_integration.send_batch.assert_called_once_with(events)
-    
+
+    async def test_slow_integration_times_out(self):
+        """Test a slow integration does not hold up the others."""
+        container = IntegrationContainer(integration_timeout_s=0.05)
+
+        async def slow_send(event):
+            await asyncio.sleep(1)
+            return True
+
+        slow = Mock()
+        slow.is_enabled.return_value = True
+        slow.send_event = slow_send
+
+        fast = Mock()
+        fast.is_enabled.return_value = True
+        fast.send_event = AsyncMock(return_value=True)
+
+        container.integrations['slow'] = slow
+        container.integrations['fast'] = fast
+
+        results = await asyncio.wait_for(container.send_event({'test': 'data'}), timeout=0.5)
+
+        assert results == {'slow': False, 'fast': True}
+
+    async def test_concurrency_capped_per_integration(self):
+        """Test concurrent sends to one integration respect max_concurrency."""
+        container = IntegrationContainer(max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def send(event):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        mock_integration = Mock()
+        mock_integration.is_enabled.return_value = True
+        mock_integration.send_event = send
+        container.integrations['mock'] = mock_integration
+
+        results = await asyncio.gather(*(container.send_event({'test': i}) for i in range(6)))
+
+        assert all(r == {'mock': True} for r in results)
+        assert peak == 2
+
+    async def test_queued_calls_share_the_timeout(self):
+        """Test calls queued behind a hung integration still finish within the timeout."""
+        container = IntegrationContainer(integration_timeout_s=0.1, max_concurrency=2)
+
+        async def hung_send(event):
+            await asyncio.sleep(10)
+            return True
+
+        hung = Mock()
+        hung.is_enabled.return_value = True
+        hung.send_event = hung_send
+        container.integrations['hung'] = hung
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await asyncio.gather(*(container.send_event({'test': i}) for i in range(6)))
+        elapsed = loop.time() - started
+
+        assert all(r == {'hung': False} for r in results)
+        # One timeout, not one per batch of max_concurrency calls
+        assert elapsed < 0.25
+
     async def test_health_check_all(self):
         """Test health check on all integrations."""
         container = IntegrationContainer()
@@ -246,6 +319,122 @@ class TestJSONExportIntegration:
         
         await integration.close()
 
+    async def test_slow_write_outlasting_timeout_lands_once(self, tmp_path):
+        """Test a write slower than the container timeout is reported once, not cancelled."""
+        config = IntegrationConfig(
+            type=IntegrationType.JSON,
+            name='test-json',
+            enabled=True,
+            config={'output_dir': str(tmp_path), 'rotation': 'none'}
+        )
+        
+        integration = JSONExportIntegration(config)
+        await integration.initialize()
+        write = integration._write_lines_sync
+        
+        def slow_write(filename, lines):
+            time.sleep(0.2)
+            write(filename, lines)
+        
+        integration._write_lines_sync = slow_write
+        container = IntegrationContainer(integration_timeout_s=0.05)
+        container.integrations['test-json'] = integration
+        
+        results = await container.send_event({'idempotency_key': 'slow'})
+        
+        assert results == {'test-json': True}
+        
+        # A cancelled caller keeps the lock until the thread has written
+        task = asyncio.create_task(integration.send_event({'idempotency_key': 'cancelled'}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not integration._lock.locked()
+        
+        lines = (tmp_path / 'wafer_events_events.jsonl').read_bytes().splitlines()
+        assert [json.loads(line)['idempotency_key'] for line in lines] == ['slow', 'cancelled']
+        
+        await integration.close()
+
+
+@pytest.mark.asyncio
+class TestELKIntegration:
+    """Test suite for ELKIntegration."""
+    
+    def make_integration(self, handler):
+        """Build an ELK integration whose HTTP calls go to `handler`."""
+        config = IntegrationConfig(
+            type=IntegrationType.ELK,
+            name='test-elk',
+            enabled=True,
+            config={'elasticsearch_url': 'http://es:9200', 'ilm_policy': 'test-policy'}
+        )
+        integration = ELKIntegration(config)
+        integration.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return integration
+    
+    async def test_ilm_policy_created_when_missing(self):
+        """Test the ILM policy is created when Elasticsearch has none."""
+        requests = []
+        
+        def handler(request):
+            requests.append((request.method, request.url.path))
+            return httpx.Response(404 if request.method == 'GET' else 200)
+        
+        integration = self.make_integration(handler)
+        await integration._create_ilm_policy()
+        
+        assert requests == [
+            ('GET', '/_ilm/policy/test-policy'),
+            ('PUT', '/_ilm/policy/test-policy')
+        ]
+    
+    async def test_existing_ilm_policy_not_overwritten(self):
+        """Test an existing ILM policy is left as operators configured it."""
+        requests = []
+        
+        def handler(request):
+            requests.append((request.method, request.url.path))
+            return httpx.Response(200, json={'test-policy': {'policy': {}}})
+        
+        integration = self.make_integration(handler)
+        await integration._create_ilm_policy()
+        
+        assert requests == [('GET', '/_ilm/policy/test-policy')]
+    
+    async def test_ilm_policy_check_error_logged(self):
+        """Test a refused ILM policy lookup is logged instead of passing silently."""
+        requests = []
+        
+        def handler(request):
+            requests.append((request.method, request.url.path))
+            return httpx.Response(403)
+        
+        integration = self.make_integration(handler)
+        with patch('shared_utils.integrations.elk.logger') as logger:
+            await integration._create_ilm_policy()
+        
+        assert requests == [('GET', '/_ilm/policy/test-policy')]
+        logger.warning.assert_called_once_with(
+            "elasticsearch_ilm_policy_check_failed",
+            policy='test-policy',
+            status=403
+        )
+    
+    async def test_index_template_references_ilm_policy(self):
+        """Test the index template attaches the configured ILM policy."""
+        templates = []
+        
+        def handler(request):
+            templates.append(json.loads(request.content))
+            return httpx.Response(200)
+        
+        integration = self.make_integration(handler)
+        await integration._create_index_template()
+        
+        assert templates[0]['settings']['index.lifecycle.name'] == integration.ilm_policy
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
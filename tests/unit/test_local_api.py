@@ -0,0 +1,114 @@
+"""Unit tests for Local API batch ingestion."""
+import orjson
+import pytest
+from uuid import uuid4
+from datetime import datetime, timezone
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'apps'))
+
+from local_api import main as local_api
+
+
+class FakeConnection:
+    """Records executemany calls; execute is unused by the batch path."""
+
+    def __init__(self):
+        self.executemany_calls = []
+
+    def transaction(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def executemany(self, sql, rows):
+        self.executemany_calls.append((sql, list(rows)))
+
+
+class FakePool:
+    """Hands out a single FakeConnection."""
+
+    def __init__(self):
+        self.con = FakeConnection()
+
+    def acquire(self):
+        return self.con
+
+    def get_size(self):
+        return 1
+
+    def get_idle_size(self):
+        return 1
+
+
+def make_event(job_id: str, kind: str, status: str) -> local_api.IngestEvent:
+    """Build a job event for ingestion."""
+    return local_api.IngestEvent(
+        idempotency_key=str(uuid4()),
+        site_id='test-fab',
+        app={'app_id': str(uuid4()), 'name': 'test-app', 'version': '1.0.0'},
+        entity={'type': 'job', 'id': job_id, 'business_key': 'test-job'},
+        event={
+            'kind': kind,
+            'at': datetime.now(timezone.utc).isoformat(),
+            'status': status,
+            'metrics': {},
+            'metadata': {}
+        }
+    )
+
+
+@pytest.fixture
+def fake_pool():
+    """Install a fake ingest pool on the app for the duration of a test."""
+    pool = FakePool()
+    local_api.app.state.pool = pool
+    yield pool
+    del local_api.app.state.pool
+
+
+@pytest.mark.asyncio
+async def test_batch_with_two_events_for_one_job(fake_pool):
+    """A started/finished pair for one job is written in one batch, not retried per event."""
+    job_id = str(uuid4())
+    events = [make_event(job_id, 'started', 'running'), make_event(job_id, 'finished', 'succeeded')]
+
+    response = await local_api.ingest_batch(events)
+
+    result = orjson.loads(response.body)
+    assert result['success'] == 2
+    assert result['failed'] == 0
+    job_calls = [
+        (sql, rows) for sql, rows in fake_pool.con.executemany_calls
+        if sql is local_api.JOB_INSERT_SQL
+    ]
+    assert len(job_calls) == 1
+    sql, rows = job_calls[0]
+    assert [row[0] for row in rows] == [job_id, job_id]
+    # Rows share a transaction, so inserted_at must not come from now()
+    assert 'clock_timestamp()' in sql
+
+
+@pytest.mark.asyncio
+async def test_batch_event_missing_field_counted_as_failed(fake_pool):
+    """An event missing a required key fails on its own; the rest of the batch is stored."""
+    good = make_event(str(uuid4()), 'started', 'running')
+    bad = make_event(str(uuid4()), 'started', 'running')
+    del bad.entity['id']
+
+    response = await local_api.ingest_batch([good, bad])
+
+    result = orjson.loads(response.body)
+    assert result['success'] == 1
+    assert result['failed'] == 1
+    assert result['failed_keys'] == [bad.idempotency_key]
+    event_rows = [
+        rows for sql, rows in fake_pool.con.executemany_calls
+        if sql is local_api.EVENT_INSERT_SQL
+    ]
+    assert [row[-1] for row in event_rows[0]] == [good.idempotency_key]
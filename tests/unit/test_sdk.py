@@ -6,7 +6,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'apps' / 'monitoring_sdk'))
 
 from monitoring_sdk.context import Monitored
-from monitoring_sdk.models import AppRef
+from monitoring_sdk.models import AppRef, EntityRef, JobEvent
+from monitoring_sdk.emitter import _dumps, _jsonable
 
 class DummyEmitter:
     def __init__(self): self.sent = []
@@ -20,3 +21,21 @@ def test_monitored_success(monkeypatch):
     assert len(emitter.sent) >= 2
     kinds = [e.event.kind for e in emitter.sent]
     assert kinds[0] == 'started' and kinds[-1] == 'finished'
+
+def test_job_event_to_json():
+    app = AppRef(app_id=uuid4(), name='test-app', version='1')
+    entity = EntityRef(type='subjob', id=uuid4(), parent_id=None, business_key='b', sub_key='s')
+    ev = JobEvent.now('started', 'fab', app, entity, 'running', metrics={'cpu_user_s': 1.0})
+    data = ev.to_json()
+    assert data['idempotency_key'] == str(ev.idempotency_key)
+    assert data['app']['app_id'] == str(app.app_id)
+    assert data['entity']['id'] == str(entity.id) and data['entity']['parent_id'] is None
+    assert data['event']['at'] == ev.event.at.isoformat()
+    assert data['event']['metrics'] == {'cpu_user_s': 1.0}
+
+def test_job_event_wire_encoding_matches_to_json():
+    app = AppRef(app_id=uuid4(), name='test-app', version='1')
+    entity = EntityRef(type='subjob', id=uuid4(), parent_id=uuid4(), business_key='b', sub_key=None)
+    ev = JobEvent.now('finished', 'fab', app, entity, 'succeeded',
+                      metrics={'duration_s': 2.5}, metadata={'batch': 7})
+    assert _dumps(_jsonable(ev)) == _dumps(ev.to_json())